@@ -17,7 +17,7 @@ Note:
 Author: Aditya Patange (https://www.github.com/AdiPat)
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from agents import FunctionTool, RunContextWrapper, WebSearchTool
 from .tools.document_tools import DocumentWriterTool
 from .models import (
@@ -38,10 +38,13 @@ class EdisonTools:
 
     Attributes:
         _tools (List[FunctionTool]): Internal list storing tool instances
+        _document_tool (Optional[DocumentWriterTool]): Document writer shared by
+            all tool calls, created on first use
     """
 
     def __init__(self):
         """Initializes the Edison tools collection."""
+        self._document_tool: Optional[DocumentWriterTool] = None
         self._tools: List[FunctionTool] = self._init_document_tools()
         self._tools_map: Dict[ToolType, FunctionTool] = {
             ToolType.UPDATE_SECTION: self._tools[0],
@@ -77,8 +80,8 @@ class EdisonTools:
             """
             try:
                 parsed = UpdateSectionArgs.model_validate_json(args)
-                tool = DocumentWriterTool(storage_dir="documents")
-                tool.update_section(
+                tool = self._get_document_tool()
+                await tool.update_section_async(
                     doc_id=parsed.doc_id,
                     title=parsed.title,
                     content=parsed.content,
@@ -98,6 +101,19 @@ class EdisonTools:
             WebSearchTool(),
         ]
 
+    def _get_document_tool(self) -> DocumentWriterTool:
+        """Returns the shared document writer, creating it on first use.
+
+        Creating a writer loads every stored document, so one writer is kept
+        for all tool calls instead of one per call.
+
+        Returns:
+            DocumentWriterTool: The shared document writer
+        """
+        if self._document_tool is None:
+            self._document_tool = DocumentWriterTool(storage_dir="documents")
+        return self._document_tool
+
     def get_tools(self) -> List[FunctionTool]:
         """Returns all available Edison tools.
 
@@ -263,3 +263,14 @@ class MergeResult(BaseModel):
     source_sections: list[str] = Field(
         default_factory=list, description="IDs of sections that were merged"
     )
+
+
+class MergeResultDelta(BaseModel):
+    """Incremental update emitted while a merge is streamed."""
+
+    delta: str = Field(
+        default="", description="Newly generated fragment of the raw model output"
+    )
+    result: Optional[MergeResult] = Field(
+        default=None, description="The final merge result, set on the last update"
+    )
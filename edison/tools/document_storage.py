@@ -12,17 +12,27 @@ Typical usage example:
 
 Note:
     All storage operations require valid document IDs and proper storage directory
-    configuration. Documents are stored as JSON files with .json extension.
+    configuration. Documents are stored as JSON files with .json extension and are
+    encoded and decoded with orjson.
+    Sections saved individually with save_section live in a "<doc_id>.sections"
+    directory next to the document file and take precedence over inline sections.
+    Loading such a document reads one file per section.
 """
 
-import json
-from typing import Dict, Optional
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from typing import Any, Dict, Optional, Set
 from datetime import datetime
 from pathlib import Path
 from ..errors import StorageError, StorageIOError
 from ..models import DocumentContent, DocumentSection, DocumentMetdataItem
 from ..common.utils import ensure_dir
 
+# Maximum number of threads used to read documents concurrently in load_all.
+LOAD_WORKERS = 16
+
 
 class DocumentStorage:
     """Interface for document persistence operations.
@@ -47,6 +57,8 @@ class DocumentStorage:
         try:
             self.storage_dir = Path(storage_dir)
             ensure_dir(str(self.storage_dir))
+            # IDs of the sections known to have their own file, per document
+            self._section_files: Dict[str, Set[str]] = {}
         except (OSError, PermissionError) as e:
             raise StorageError(f"Failed to initialize storage at {storage_dir}: {e}")
 
@@ -72,11 +84,66 @@ class DocumentStorage:
         safe_id = self._sanitize_doc_id(doc_id)
         return self.storage_dir / f"{safe_id}.json"
 
+    def _get_sections_dir(self, doc_id: str) -> Path:
+        """Get the directory holding individually saved sections of a document."""
+        safe_id = self._sanitize_doc_id(doc_id)
+        return self.storage_dir / f"{safe_id}.sections"
+
+    def _get_section_path(self, doc_id: str, section_id: str) -> Path:
+        """Get full path for an individually saved section."""
+        safe_section_id = self._sanitize_doc_id(section_id)
+        return self._get_sections_dir(doc_id) / f"{safe_section_id}.json"
+
+    def _serialize_section(self, section: DocumentSection) -> Dict[str, Any]:
+        """Convert a section into a JSON-serializable dictionary."""
+        return {
+            "title": section.title,
+            "content": section.content,
+            "last_modified": (
+                section.last_modified.isoformat() if section.last_modified else None
+            ),
+            "version": section.version,
+            "context_tokens": section.context_tokens,
+        }
+
+    def _deserialize_section(self, section: Dict[str, Any]) -> DocumentSection:
+        """Reconstruct a section from its dictionary representation."""
+        return DocumentSection(
+            title=section["title"],
+            content=section["content"],
+            last_modified=(
+                datetime.fromisoformat(section["last_modified"])
+                if section.get("last_modified")
+                else None
+            ),
+            version=section["version"],
+            context_tokens=section.get("context_tokens", 0),
+        )
+
+    def _serialize_document(
+        self, document: DocumentContent, sections: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Convert document metadata and the given inline sections to a dictionary."""
+        return {
+            "sections": sections,
+            "metadata": [
+                {"key": item.key, "value": item.value} for item in document.metadata
+            ],
+            "created_at": (
+                document.created_at.isoformat() if document.created_at else None
+            ),
+            "last_modified": (
+                document.last_modified.isoformat() if document.last_modified else None
+            ),
+            "version": document.version,
+        }
+
     def save_document(self, doc_id: str, document: DocumentContent) -> None:
         """Saves document content to storage.
 
         Persists the complete document content including sections, metadata,
         and version information to a JSON file in the storage directory.
+        Any individually saved sections are folded back into the document file.
 
         Args:
             doc_id: Unique identifier for the document
@@ -88,40 +155,83 @@ class DocumentStorage:
         """
         try:
             doc_path = self._get_doc_path(doc_id)
-            doc_dict = {
-                "sections": {
-                    id: {
-                        "title": section.title,
-                        "content": section.content,
-                        "last_modified": (
-                            section.last_modified.isoformat()
-                            if section.last_modified
-                            else None
-                        ),
-                        "version": section.version,
-                        "context_tokens": section.context_tokens,
-                    }
+            doc_dict = self._serialize_document(
+                document,
+                {
+                    id: self._serialize_section(section)
                     for id, section in (document.sections or {}).items()
                 },
-                "metadata": [
-                    {"key": item.key, "value": item.value} for item in document.metadata
-                ],
-                "created_at": (
-                    document.created_at.isoformat() if document.created_at else None
-                ),
-                "last_modified": (
-                    document.last_modified.isoformat()
-                    if document.last_modified
-                    else None
-                ),
-                "version": document.version,
-            }
+            )
+
+            doc_path.write_bytes(orjson.dumps(doc_dict, option=orjson.OPT_INDENT_2))
 
-            with doc_path.open("w") as f:
-                json.dump(doc_dict, f, indent=2)
+            sections_dir = self._get_sections_dir(doc_id)
+            if sections_dir.exists():
+                shutil.rmtree(sections_dir)
+            self._section_files[doc_id] = set()
         except Exception as e:
             raise StorageIOError(f"Failed to save document {doc_id}: {e}")
 
+    def save_section(
+        self, doc_id: str, section_id: str, section: DocumentSection
+    ) -> None:
+        """Saves a single section without rewriting the rest of the document.
+
+        The document manifest must be saved with save_manifest afterwards so
+        that the section is listed in the document.
+
+        Args:
+            doc_id: Unique identifier for the document
+            section_id: Identifier of the section within the document
+            section: Section to be saved
+
+        Raises:
+            StorageIOError: If section cannot be saved due to IO errors
+        """
+        try:
+            section_path = self._get_section_path(doc_id, section_id)
+            section_path.parent.mkdir(exist_ok=True)
+            section_path.write_bytes(
+                orjson.dumps(
+                    self._serialize_section(section), option=orjson.OPT_INDENT_2
+                )
+            )
+            self._section_files.setdefault(doc_id, set()).add(section_id)
+        except Exception as e:
+            raise StorageIOError(
+                f"Failed to save section {section_id} of document {doc_id}: {e}"
+            )
+
+    def save_manifest(self, doc_id: str, document: DocumentContent) -> None:
+        """Saves document metadata and section order.
+
+        Sections are only referenced by ID. Sections that do not have their own
+        file yet, such as those written by save_document, are saved with
+        save_section first, so the manifest stays small however many sections
+        the document has.
+
+        Args:
+            doc_id: Unique identifier for the document
+            document: Document content object whose manifest is saved
+
+        Raises:
+            StorageIOError: If manifest cannot be saved due to IO errors
+        """
+        try:
+            saved = self._section_files.get(doc_id, set())
+            for id, section in (document.sections or {}).items():
+                if id not in saved:
+                    self.save_section(doc_id, id, section)
+
+            doc_dict = self._serialize_document(document, {})
+            doc_dict["section_ids"] = list(document.sections or {})
+
+            self._get_doc_path(doc_id).write_bytes(
+                orjson.dumps(doc_dict, option=orjson.OPT_INDENT_2)
+            )
+        except Exception as e:
+            raise StorageIOError(f"Failed to save manifest of document {doc_id}: {e}")
+
     def load_document(self, doc_id: str) -> Optional[DocumentContent]:
         """Loads document content from storage.
 
@@ -144,23 +254,19 @@ class DocumentStorage:
             return None
 
         try:
-            with doc_path.open("r") as f:
-                doc_dict = json.load(f)
+            doc_dict = orjson.loads(doc_path.read_bytes())
 
             sections = {
-                id: DocumentSection(
-                    title=section["title"],
-                    content=section["content"],
-                    last_modified=(
-                        datetime.fromisoformat(section["last_modified"])
-                        if section.get("last_modified")
-                        else None
-                    ),
-                    version=section["version"],
-                    context_tokens=section.get("context_tokens", 0),
-                )
+                id: self._deserialize_section(section)
                 for id, section in doc_dict.get("sections", {}).items()
             }
+            saved: Set[str] = set()
+            if "section_ids" in doc_dict:
+                sections = {
+                    id: self._load_section(doc_id, id, sections, saved)
+                    for id in doc_dict["section_ids"]
+                }
+            self._section_files[doc_id] = saved
 
             metadata = [
                 DocumentMetdataItem(key=item["key"], value=item["value"])
@@ -186,6 +292,61 @@ class DocumentStorage:
         except Exception as e:
             raise StorageIOError(f"Failed to load document {doc_id}: {e}")
 
+    def _load_section(
+        self,
+        doc_id: str,
+        section_id: str,
+        inline: Dict[str, DocumentSection],
+        saved: Set[str],
+    ) -> DocumentSection:
+        """Load an individually saved section, falling back to the inline copy.
+
+        The section ID is added to saved if the section has its own file.
+        """
+        section_path = self._get_section_path(doc_id, section_id)
+        if not section_path.exists():
+            return inline[section_id]
+
+        saved.add(section_id)
+        return self._deserialize_section(orjson.loads(section_path.read_bytes()))
+
+    def load_all(self) -> Dict[str, DocumentContent]:
+        """Loads every document in storage.
+
+        Scans the storage directory once and reads the documents concurrently.
+        Documents that cannot be loaded are skipped.
+
+        Returns:
+            Dictionary mapping document IDs to their content
+
+        Raises:
+            StorageIOError: If storage directory cannot be read
+        """
+        try:
+            with os.scandir(self.storage_dir) as entries:
+                doc_ids = [
+                    entry.name[: -len(".json")]
+                    for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()
+                ]
+        except OSError as e:
+            raise StorageIOError(f"Failed to list documents: {e}")
+
+        with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+            documents = executor.map(self._load_document_or_none, doc_ids)
+            return {
+                doc_id: document
+                for doc_id, document in zip(doc_ids, documents)
+                if document is not None
+            }
+
+    def _load_document_or_none(self, doc_id: str) -> Optional[DocumentContent]:
+        """Load a document, returning None if it cannot be loaded."""
+        try:
+            return self.load_document(doc_id)
+        except StorageIOError:
+            return None
+
     def list_documents(self) -> Dict[str, Dict[str, str]]:
         """List all available documents with metadata.
 
@@ -206,17 +367,12 @@ class DocumentStorage:
                 doc_id = doc_path.stem
 
                 try:
-                    with doc_path.open("r") as f:
-                        doc_dict = json.load(f)
-                        metadata_dict = {}
-                        for item in doc_dict.get("metadata", []):
-                            if (
-                                isinstance(item, dict)
-                                and "key" in item
-                                and "value" in item
-                            ):
-                                metadata_dict[item["key"]] = item["value"]
-                        documents[doc_id] = metadata_dict
+                    doc_dict = orjson.loads(doc_path.read_bytes())
+                    metadata_dict = {}
+                    for item in doc_dict.get("metadata", []):
+                        if isinstance(item, dict) and "key" in item and "value" in item:
+                            metadata_dict[item["key"]] = item["value"]
+                    documents[doc_id] = metadata_dict
                 except Exception as e:
                     continue
 
@@ -1,43 +1,64 @@
 """Document management tools with versioning and organization."""
 
+import asyncio
+import io
 import os
-from typing import Dict, Optional, Tuple
+import threading
+from typing import Dict, Optional, Set, Tuple
 from datetime import datetime
 from pathlib import Path
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from ..models import DocumentContent, DocumentSection, ComparisonResult, MergeResult
 from ..errors import DocumentNotFoundError
 from .document_storage import DocumentStorage, ensure_dir
-from .text_tools import TextAnalyzer
+from .text_tools import SectionIndex, TextAnalyzer
+
+# Sections scoring above MERGE_THRESHOLD are merged into the matching section.
+# Above DETERMINISTIC_MERGE_THRESHOLD the sections overlap so much that they
+# are merged locally, paragraph by paragraph, instead of asking the model,
+# provided one section's paragraphs all reappear in the other.
+MERGE_THRESHOLD = 0.7
+DETERMINISTIC_MERGE_THRESHOLD = 0.9
+
+# Markdown files are rewritten at most once per delay window, in seconds.
+MARKDOWN_FLUSH_DELAY = 0.5
 
 
 class DocumentWriterTool:
     """A tool for managing document content with versioning and organization."""
 
     def __init__(
-        self, storage_dir: str = "documents", openai_client: Optional[OpenAI] = None
+        self,
+        storage_dir: str = "documents",
+        openai_client: Optional[OpenAI] = None,
+        async_openai_client: Optional[AsyncOpenAI] = None,
     ):
         """Initialize the document writer tool.
 
         Args:
             storage_dir: Path to directory for storing documents and their metadata
             openai_client: Optional OpenAI client for AI-assisted operations
+            async_openai_client: Optional AsyncOpenAI client for update_section_async
         """
         ensure_dir(storage_dir)
         self.storage_dir = storage_dir
         self.storage = DocumentStorage(storage_dir)
         self.documents: Dict[str, DocumentContent] = {}
-        self.text_analyzer = TextAnalyzer(openai_client=openai_client)
+        self.text_analyzer = TextAnalyzer(
+            openai_client=openai_client, async_openai_client=async_openai_client
+        )
+        self._section_indexes: Dict[str, SectionIndex] = {}
+        self._pending_markdown: Set[str] = set()
+        self._markdown_timer: Optional[threading.Timer] = None
+        self._markdown_lock = threading.Lock()
+        self._update_locks: Dict[str, asyncio.Lock] = {}
+        self._update_locks_loop: Optional[asyncio.AbstractEventLoop] = None
         self._load_existing_documents()
 
     def _load_existing_documents(self):
         """Load existing documents from storage."""
-        for doc_id in self.storage.list_documents():
-            try:
-                self.documents[doc_id] = self.storage.load_document(doc_id)
-            except Exception:
-                continue
+        self.documents.update(self.storage.load_all())
 
     def create_document(self, doc_id: str) -> DocumentContent:
         """Creates a new empty document and initializes it in storage.
@@ -53,6 +74,7 @@ class DocumentWriterTool:
             sections={}, metadata=[], created_at=now, last_modified=now, version=0
         )
         self.documents[doc_id] = doc
+        self._section_indexes.pop(doc_id, None)
         self.storage.save_document(doc_id, doc)
         return doc
 
@@ -72,6 +94,21 @@ class DocumentWriterTool:
             raise DocumentNotFoundError(f"Document {doc_id} not found")
         return self.documents[doc_id]
 
+    def _get_section_index(self, doc_id: str, doc: DocumentContent) -> SectionIndex:
+        """Get the search index of a document's sections, building it on first use.
+
+        Args:
+            doc_id: Document identifier
+            doc: Document whose sections are indexed
+
+        Returns:
+            The document's section index
+        """
+        index = self._section_indexes.get(doc_id)
+        if index is None:
+            index = self._section_indexes[doc_id] = SectionIndex(doc.sections)
+        return index
+
     def _compare_sections_with_ai(
         self, section1: DocumentSection, section2: DocumentSection
     ) -> Tuple[float, str]:
@@ -113,60 +150,192 @@ class DocumentWriterTool:
         Returns:
             The updated or created section
         """
+        doc, section_id, incoming, merge_result = self._plan_update(
+            doc_id, title, content
+        )
+        if section_id is not None and merge_result is None:
+            # Try to merge the sections using AI
+            merge_result = self.text_analyzer.merge_sections(
+                doc.sections[section_id], incoming
+            )
+
+        return self._store_section(doc_id, doc, section_id, incoming, merge_result)
+
+    async def update_section_async(
+        self, doc_id: str, title: str, content: str
+    ) -> DocumentSection:
+        """Updates or creates a document section without blocking the event loop.
+
+        Behaves like update_section, but AI-assisted merges are awaited on the
+        async OpenAI client so other tasks can run meanwhile. Concurrent updates
+        to the same document are applied one at a time, so each merges into
+        the result of the previous one.
+
+        Args:
+            doc_id: Document identifier
+            title: Section title
+            content: Section content in markdown format
+
+        Returns:
+            The updated or created section
+        """
+        async with self._update_lock(doc_id):
+            doc, section_id, incoming, merge_result = self._plan_update(
+                doc_id, title, content
+            )
+            if section_id is not None and merge_result is None:
+                merge_result = await self.text_analyzer.merge_sections_async(
+                    doc.sections[section_id], incoming
+                )
+
+            return self._store_section(doc_id, doc, section_id, incoming, merge_result)
+
+    def _update_lock(self, doc_id: str) -> asyncio.Lock:
+        """Return the lock serializing async updates to a document.
+
+        A lock is tied to the event loop it is first used in, so the locks are
+        replaced whenever the tool is used from a different loop.
+
+        Args:
+            doc_id: Document identifier
+
+        Returns:
+            The document's update lock
+        """
+        loop = asyncio.get_running_loop()
+        if self._update_locks_loop is not loop:
+            self._update_locks = {}
+            self._update_locks_loop = loop
+        lock = self._update_locks.get(doc_id)
+        if lock is None:
+            lock = self._update_locks[doc_id] = asyncio.Lock()
+        return lock
+
+    def _plan_update(
+        self, doc_id: str, title: str, content: str
+    ) -> Tuple[DocumentContent, Optional[str], DocumentSection, Optional[MergeResult]]:
+        """Find the section new content belongs to and merge it locally if possible.
 
+        Args:
+            doc_id: Document identifier, created if it does not exist
+            title: Section title
+            content: Section content
+
+        Returns:
+            Tuple of (document, ID of the section to merge into or None, section
+            built from the update, local merge result). The merge result is
+            None when there is no section to merge into or when the merge
+            needs AI assistance.
+        """
         doc = (
             self.get_document(doc_id)
             if doc_id in self.documents
             else self.create_document(doc_id)
         )
-        now = datetime.now()
+        incoming = DocumentSection(
+            title=title, content=content, last_modified=datetime.now(), version=0
+        )
 
-        # Try to find matching section
-        matched_section_id, similarity = self.text_analyzer.find_most_relevant_section(
-            doc, title, content
+        index = self._get_section_index(doc_id, doc)
+        section_id, similarity = self.text_analyzer.find_most_relevant_section(
+            doc, title, content, index=index
         )
+        if not section_id or similarity <= MERGE_THRESHOLD:
+            return doc, None, incoming, None
 
-        if matched_section_id and similarity > 0.7:
-            # Found similar section, try to merge
-            existing_section = doc.sections[matched_section_id]
-            temp_section = DocumentSection(
-                title=title, content=content, last_modified=now, version=0
+        merge_result = None
+        if similarity > DETERMINISTIC_MERGE_THRESHOLD:
+            merge_result = self.text_analyzer.deterministic_merge(
+                doc.sections[section_id], incoming
             )
+        return doc, section_id, incoming, merge_result
+
+    def _store_section(
+        self,
+        doc_id: str,
+        doc: DocumentContent,
+        section_id: Optional[str],
+        incoming: DocumentSection,
+        merge_result: Optional[MergeResult],
+    ) -> DocumentSection:
+        """Write a merged or new section to the document and persist it.
 
-            # Try to merge the sections using AI
-            merge_result = self.text_analyzer.merge_sections(
-                existing_section, temp_section
-            )
+        Args:
+            doc_id: Document identifier
+            doc: Document to write to
+            section_id: ID of the merged section, or None to add a new section
+            incoming: Section built from the update
+            merge_result: Result of merging into section_id, if any
+
+        Returns:
+            The updated or created section
+        """
+        now = incoming.last_modified
+
+        if section_id is not None:
             section = DocumentSection(
                 title=merge_result.merged_title,
                 content=merge_result.merged_content,
                 last_modified=now,
-                version=existing_section.version + 1,
-                context_tokens=len(merge_result.merged_content.split()),
+                version=doc.sections[section_id].version + 1,
+                context_tokens=self.text_analyzer.count_tokens(
+                    merge_result.merged_content
+                ),
             )
-            doc.sections[matched_section_id] = section
         else:
             # Create new section
             section_id = f"section_{len(doc.sections) + 1}"
             section = DocumentSection(
-                title=title,
-                content=content,
+                title=incoming.title,
+                content=incoming.content,
                 last_modified=now,
                 version=0,
-                context_tokens=len(content.split()),
+                context_tokens=self.text_analyzer.count_tokens(incoming.content),
             )
+        # The markdown writer iterates the sections on the timer thread
+        with self._markdown_lock:
             doc.sections[section_id] = section
+        self._get_section_index(doc_id, doc).update(section_id, section)
 
         # Update document metadata
         doc.last_modified = now
         doc.version += 1
 
-        # Save document and markdown
-        self.storage.save_document(doc_id, doc)
-        self._write_markdown(doc_id, doc)
+        # Save the changed section, document manifest and markdown
+        self.storage.save_section(doc_id, section_id, section)
+        self.storage.save_manifest(doc_id, doc)
+        self._schedule_markdown(doc_id)
 
         return section
 
+    def _schedule_markdown(self, doc_id: str):
+        """Mark a document's markdown as stale and schedule a deferred write.
+
+        Updates arriving within MARKDOWN_FLUSH_DELAY of each other are
+        coalesced into a single write per document.
+
+        Args:
+            doc_id: Document identifier
+        """
+        with self._markdown_lock:
+            self._pending_markdown.add(doc_id)
+            if self._markdown_timer is None:
+                self._markdown_timer = threading.Timer(MARKDOWN_FLUSH_DELAY, self.flush)
+                self._markdown_timer.start()
+
+    def flush(self):
+        """Write markdown files for all documents with pending updates."""
+        with self._markdown_lock:
+            if self._markdown_timer is not None:
+                self._markdown_timer.cancel()
+                self._markdown_timer = None
+
+            # Documents stay pending until written, so a failed write is
+            # retried by the next flush
+            for doc_id in list(self._pending_markdown):
+                self._write_markdown(doc_id, self.documents[doc_id])
+                self._pending_markdown.discard(doc_id)
+
     def _write_markdown(self, doc_id: str, doc: DocumentContent):
         """Write document content to markdown file.
 
@@ -175,12 +344,20 @@ class DocumentWriterTool:
             doc: Document to write
         """
         markdown_path = Path(self.storage_dir) / f"{doc_id}.md"
+        temp_path = markdown_path.with_name(f"{markdown_path.name}.tmp")
 
-        content = []
-        for section in doc.sections.values():
+        buffer = io.StringIO()
+        write = buffer.write
+        for index, section in enumerate(doc.sections.values()):
+            if index:
+                write("\n")
             # Add section title as h2
-            content.append(f"\n## {section.title}\n")
+            write("\n## ")
+            write(section.title)
+            write("\n\n")
             # Add section content, preserving existing markdown
-            content.append(f"{section.content}\n")
+            write(section.content)
+            write("\n")
 
-        markdown_path.write_text("\n".join(content))
+        temp_path.write_bytes(buffer.getvalue().encode("utf-8"))
+        os.replace(temp_path, markdown_path)
@@ -0,0 +1,191 @@
+"""MinHash signatures for approximate set similarity.
+
+This module provides fixed-length MinHash signatures over token sets. Two
+signatures can be compared in O(NUM_PERM) regardless of how many tokens the
+underlying texts contain, which makes them suitable for cheaply narrowing down
+candidate sections before running an exact similarity scorer. MinHashLSH
+indexes signatures so that candidates can be found without comparing against
+every stored signature.
+
+Typical usage example:
+    sig1 = minhash_signature("the quick brown fox".split())
+    sig2 = minhash_signature("the quick red fox".split())
+    estimates = jaccard_estimates(np.stack([sig1]), sig2)
+
+    index = MinHashLSH()
+    index.insert("section_1", sig1)
+    candidates = index.query(sig2)
+
+Note:
+    Tokens are hashed with BLAKE2b rather than Python's built-in hash, which is
+    salted per process, so signatures and LSH candidates are the same in every
+    run.
+"""
+
+from hashlib import blake2b
+from typing import Dict, Iterable, List, Set
+import numpy as np
+
+NUM_PERM = 128
+
+_SEEDS = np.random.default_rng(0x5EED).integers(
+    0, np.iinfo(np.uint64).max, size=NUM_PERM, dtype=np.uint64, endpoint=True
+)
+_EMPTY_SIGNATURE = np.full(NUM_PERM, np.iinfo(np.uint64).max, dtype=np.uint64)
+_EMPTY_SIGNATURE.flags.writeable = False
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """Apply the splitmix64 finalizer to an array of uint64 values."""
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def minhash_signature(tokens: Iterable[str]) -> np.ndarray:
+    """Compute the MinHash signature of a token set.
+
+    Args:
+        tokens: Tokens to hash. Duplicates are ignored.
+
+    Returns:
+        Read-only uint64 array of shape (NUM_PERM,)
+    """
+    hashes = np.frombuffer(
+        b"".join(
+            blake2b(token.encode("utf-8"), digest_size=8).digest()
+            for token in set(tokens)
+        ),
+        dtype=np.uint64,
+    )
+    if not hashes.size:
+        return _EMPTY_SIGNATURE
+
+    signature = _mix(hashes[:, None] ^ _SEEDS[None, :]).min(axis=0)
+    signature.flags.writeable = False
+    return signature
+
+
+def jaccard_estimates(signatures: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Estimate Jaccard similarity between a query and many signatures.
+
+    Args:
+        signatures: Array of shape (N, NUM_PERM) with one signature per row
+        query: Signature of shape (NUM_PERM,) to compare against
+
+    Returns:
+        Array of shape (N,) with estimated similarities between 0.0 and 1.0
+    """
+    return (signatures == query).mean(axis=1)
+
+
+class MinHashLSH:
+    """Locality-sensitive hashing index over MinHash signatures.
+
+    Signatures are split into bands of rows; keys whose signatures agree on
+    every row of at least one band are returned as candidates by query. The
+    index can be updated incrementally as keys are inserted and removed.
+
+    Attributes:
+        bands (int): Number of bands each signature is split into
+        rows (int): Number of signature rows per band
+    """
+
+    def __init__(self, bands: int = 16, rows: int = 8):
+        """Initialize an empty index.
+
+        Args:
+            bands: Number of bands each signature is split into
+            rows: Number of signature rows per band
+
+        Raises:
+            ValueError: If bands * rows does not equal NUM_PERM
+        """
+        if bands * rows != NUM_PERM:
+            raise ValueError(f"bands * rows must equal {NUM_PERM}")
+
+        self.bands = bands
+        self.rows = rows
+        self._buckets: List[Dict[bytes, Set[str]]] = [{} for _ in range(bands)]
+        self._band_keys: Dict[str, List[bytes]] = {}
+
+    @classmethod
+    def for_threshold(cls, threshold: float) -> "MinHashLSH":
+        """Create an index tuned to find keys above a Jaccard similarity.
+
+        Keys become likely candidates once their similarity exceeds roughly
+        (1 / bands) ** (1 / rows); the split whose threshold is closest to the
+        requested one is chosen.
+
+        Args:
+            threshold: Target Jaccard similarity between 0.0 and 1.0
+
+        Returns:
+            An empty index
+
+        Raises:
+            ValueError: If threshold is not between 0.0 and 1.0
+        """
+        if not 0.0 <= threshold <= 1.0:
+            raise ValueError("threshold must be between 0.0 and 1.0")
+
+        splits = [
+            (b, NUM_PERM // b) for b in range(1, NUM_PERM + 1) if NUM_PERM % b == 0
+        ]
+        bands, rows = min(
+            splits, key=lambda split: abs((1 / split[0]) ** (1 / split[1]) - threshold)
+        )
+        return cls(bands=bands, rows=rows)
+
+    def __len__(self) -> int:
+        return len(self._band_keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._band_keys
+
+    def _bands_of(self, signature: np.ndarray) -> List[bytes]:
+        """Split a signature into hashable band keys."""
+        return [band.tobytes() for band in signature.reshape(self.bands, self.rows)]
+
+    def insert(self, key: str, signature: np.ndarray) -> None:
+        """Insert a key, replacing any signature previously stored for it.
+
+        Args:
+            key: Key to index
+            signature: MinHash signature of the key's token set
+        """
+        self.remove(key)
+        band_keys = self._bands_of(signature)
+        for buckets, band_key in zip(self._buckets, band_keys):
+            buckets.setdefault(band_key, set()).add(key)
+        self._band_keys[key] = band_keys
+
+    def remove(self, key: str) -> None:
+        """Remove a key from the index if present.
+
+        Args:
+            key: Key to remove
+        """
+        band_keys = self._band_keys.pop(key, None)
+        if band_keys is None:
+            return
+
+        for buckets, band_key in zip(self._buckets, band_keys):
+            bucket = buckets[band_key]
+            bucket.discard(key)
+            if not bucket:
+                del buckets[band_key]
+
+    def query(self, signature: np.ndarray) -> Set[str]:
+        """Find keys sharing at least one band with the given signature.
+
+        Args:
+            signature: MinHash signature to look up
+
+        Returns:
+            Set of candidate keys
+        """
+        candidates: Set[str] = set()
+        for buckets, band_key in zip(self._buckets, self._bands_of(signature)):
+            candidates.update(buckets.get(band_key, ()))
+        return candidates
@@ -1,8 +1,8 @@
 """Text Analysis Tools Module.
 
 This module provides tools for document comparison, text analysis, and content processing.
-It includes functionality for calculating text similarity using sequence matching and
-merging document sections using AI assistance.
+It includes functionality for calculating text similarity using a normalized Indel
+(LCS-based) distance and merging document sections using AI assistance.
 
 Typical usage example:
     analyzer = TextAnalyzer()
@@ -16,39 +16,467 @@ Note:
 Author: Aditya Patange (https://www.github.com/AdiPat)
 """
 
-import re
 import os
-from typing import Dict, Optional, Tuple
-from difflib import SequenceMatcher
-from openai import OpenAI
-from ..models import DocumentSection, DocumentContent, ComparisonResult, MergeResult
+import time
+import asyncio
+import hashlib
+import weakref
+from importlib.util import find_spec
+from collections import OrderedDict
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+from pydantic import BaseModel
+from ..models import (
+    DocumentSection,
+    DocumentContent,
+    ComparisonResult,
+    MergeResult,
+    MergeResultDelta,
+)
+from .minhash import MinHashLSH, minhash_signature, jaccard_estimates
+from ._fastsim import dice_scores, pack_bigrams, text_bigrams
+
+# Documents with more sections than this are narrowed down with MinHash
+# estimates before running the exact (and much slower) edit-distance scorer.
+MINHASH_MIN_SECTIONS = 64
+MINHASH_CANDIDATES = 16
+
+# Token-set Jaccard above which sections are likely to share an LSH bucket.
+# Sections worth merging often share only half of their words.
+LSH_THRESHOLD = 0.5
+
+# Content is only scored exactly for the sections sharing the most character
+# bigrams with the query content.
+DICE_CANDIDATES = 10
+
+# Paragraphs at least this similar are treated as two versions of the same
+# paragraph when sections are merged locally.
+PARAGRAPH_MATCH_THRESHOLD = 0.8
+
+# Batched scoring is spread over all CPU cores once there are enough sections
+# for the speedup to outweigh the thread startup cost.
+CDIST_PARALLEL_MIN_CHOICES = 256
+
+# Structured comparisons and merges do not need a large model; a small one
+# answers much faster and at a fraction of the cost.
+DEFAULT_MODEL = "gpt-4o-mini"
+
+# AI comparison and merge results are cached per analyzer so repeated requests
+# for the same pair of sections do not hit the API again.
+RESULT_CACHE_SIZE = 256
+RESULT_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Prompt templates, bound once: title1, content1, title2, content2
+_SECTIONS_TEMPLATE = "Section 1 ({}):\n{}\n\nSection 2 ({}):\n{}"
+_COMPARE_PROMPT = (
+    "Compare these two document sections:\n\n" + _SECTIONS_TEMPLATE
+).format
+_MERGE_PROMPT = (
+    "Merge these two document sections into a unified section:\n\n" + _SECTIONS_TEMPLATE
+).format
+
+# At most this many async API requests are in flight per analyzer at a time.
+MAX_CONCURRENT_REQUESTS = 8
+
+# Batched merges are sent to the API in chunks of at most this many pairs.
+MERGE_BATCH_SIZE = 20
+
+
+# Default clients are shared so their keep-alive pools are reused across
+# analyzers, and multiplex requests over HTTP/2 when the optional h2 package
+# is installed.
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Shared async clients, keyed by event loop
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+@lru_cache(maxsize=1)
+def _default_openai() -> OpenAI:
+    """Return the process-wide OpenAI client used when none is provided."""
+    return OpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        http_client=DefaultHttpxClient(http2=HTTP2_AVAILABLE),
+    )
+
+
+def _default_async_openai() -> AsyncOpenAI:
+    """Return the AsyncOpenAI client shared on the running event loop.
+
+    Async connections cannot outlive the event loop that opened them, so one
+    client is kept per loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE),
+        )
+    return client
+
+
+@lru_cache(maxsize=8192)
+def _normalize(text: str) -> str:
+    """Return the cached lowercase form of a text used for similarity scoring."""
+    return text.lower()
+
+
+@lru_cache(maxsize=4096)
+def _tokens(text: str) -> Tuple[str, ...]:
+    """Return the cached whitespace-separated lowercase tokens of a text."""
+    return tuple(_normalize(text).split())
+
+
+@lru_cache(maxsize=4096)
+def _text_signature(text: str) -> np.ndarray:
+    """Return the cached MinHash signature of a text's lowercase tokens."""
+    return minhash_signature(_tokens(text))
+
+
+@lru_cache(maxsize=4096)
+def _bigrams(text: str) -> np.ndarray:
+    """Return the cached, encoded character bigrams of a text."""
+    return text_bigrams(text)
+
+
+def _dice_prefilter(query: str, positions: np.ndarray, texts: List[str]) -> np.ndarray:
+    """Keep the positions whose texts best match the query on bigram Dice.
+
+    Args:
+        query: Text to compare against
+        positions: Positions in texts to choose from
+        texts: Texts to compare, indexed by position
+
+    Returns:
+        Up to DICE_CANDIDATES of the given positions, in their original order
+    """
+    if len(positions) <= DICE_CANDIDATES:
+        return positions
+
+    corpus, offsets = pack_bigrams([_bigrams(texts[i]) for i in positions])
+    scores = dice_scores(_bigrams(query), corpus, offsets)
+    top = np.sort(np.argpartition(-scores, DICE_CANDIDATES)[:DICE_CANDIDATES])
+    return positions[top]
+
+
+@lru_cache(maxsize=8192)
+def _pair_similarity(text1: str, text2: str) -> float:
+    """Return the cached Indel similarity of an ordered pair of texts."""
+    return Indel.normalized_similarity(text1, text2)
+
+
+def _batch_similarity(query: str, choices: List[str]) -> np.ndarray:
+    """Score a query against many texts in a single batched call.
+
+    Matches calculate_similarity, including a score of 0.0 whenever either
+    text is empty.
+    """
+    if not query:
+        return np.zeros(len(choices))
+
+    scores = process.cdist(
+        [query],
+        choices,
+        scorer=Indel.normalized_similarity,
+        dtype=np.float64,
+        workers=-1 if len(choices) >= CDIST_PARALLEL_MIN_CHOICES else 1,
+    )[0]
+    scores[np.fromiter((not choice for choice in choices), dtype=bool)] = 0.0
+    return scores
+
+
+def _paragraphs(text: str) -> List[str]:
+    """Split text into its non-blank paragraphs."""
+    return [p for p in text.split("\n\n") if p.strip()]
+
+
+def _merge_paragraphs(
+    paragraphs1: List[str], paragraphs2: List[str]
+) -> Tuple[List[str], int]:
+    """Merge two paragraph sequences along their longest common subsequence.
+
+    Paragraphs match when their Indel similarity is at least
+    PARAGRAPH_MATCH_THRESHOLD, so an edited paragraph is recognized as a new
+    version of the old one. Matched paragraphs appear once, as their version
+    from paragraphs2.
+
+    Returns:
+        Tuple of (merged paragraphs, number of matched paragraph pairs)
+    """
+    n, m = len(paragraphs1), len(paragraphs2)
+    if not n or not m:
+        return paragraphs1 + paragraphs2, 0
+
+    matches = (
+        process.cdist(
+            [p.strip() for p in paragraphs1],
+            [p.strip() for p in paragraphs2],
+            scorer=Indel.normalized_similarity,
+            dtype=np.float64,
+        )
+        >= PARAGRAPH_MATCH_THRESHOLD
+    ).tolist()
+
+    # lcs[i][j] is the LCS length of paragraphs1[i:] and paragraphs2[j:]
+    lcs = [[0] * (m + 1) for _ in range(n + 1)]
+    for i in range(n - 1, -1, -1):
+        for j in range(m - 1, -1, -1):
+            if matches[i][j]:
+                lcs[i][j] = lcs[i + 1][j + 1] + 1
+            else:
+                lcs[i][j] = max(lcs[i + 1][j], lcs[i][j + 1])
+
+    merged = []
+    i = j = 0
+    while i < n and j < m:
+        if matches[i][j] and lcs[i][j] == lcs[i + 1][j + 1] + 1:
+            merged.append(paragraphs2[j])
+            i += 1
+            j += 1
+        elif lcs[i + 1][j] >= lcs[i][j + 1]:
+            merged.append(paragraphs1[i])
+            i += 1
+        else:
+            merged.append(paragraphs2[j])
+            j += 1
+
+    merged.extend(paragraphs1[i:])
+    merged.extend(paragraphs2[j:])
+    return merged, lcs[0][0]
+
+
+def _section_signature(title: str, content: str) -> np.ndarray:
+    """Return the MinHash signature of the union of title and content tokens."""
+    return np.minimum(_text_signature(title), _text_signature(content))
+
+
+def _failed_comparison(error: Exception) -> ComparisonResult:
+    """Build the zero-similarity result returned when a comparison fails."""
+    # Fields are produced locally, so validation is skipped
+    return ComparisonResult.model_construct(
+        similarity_score=0.0,
+        explanation=f"Failed to compare sections: {str(error)}",
+    )
+
+
+def _fallback_merge(section: DocumentSection) -> MergeResult:
+    """Build the merge result returned when a merge fails, keeping the section."""
+    return MergeResult.model_construct(
+        merged_title=section.title,
+        merged_content=section.content,
+        source_sections=[section.title],
+    )
+
+
+class SectionIndex:
+    """Column-oriented view of a document's sections for batched scoring.
+
+    Section IDs and lowercase titles and contents are kept in parallel lists
+    that are handed directly to the batched scorer, instead of being gathered
+    from the section models on every search. The MinHash LSH index used to
+    narrow down large documents is built on first use. Both are updated
+    incrementally as sections are written.
+
+    Attributes:
+        ids: Section IDs in document order
+        titles: Lowercase section titles, aligned with ids
+        contents: Lowercase section contents, aligned with ids
+    """
+
+    def __init__(self, sections: Optional[Dict[str, DocumentSection]] = None):
+        """Initialize the index.
+
+        Args:
+            sections: Optional sections to index, keyed by section ID
+        """
+        sections = sections or {}
+        self.ids: List[str] = list(sections)
+        self.titles: List[str] = [_normalize(s.title) for s in sections.values()]
+        self.contents: List[str] = [_normalize(s.content) for s in sections.values()]
+        self._positions: Dict[str, int] = {sid: i for i, sid in enumerate(self.ids)}
+        self._lsh: Optional[MinHashLSH] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def lsh(self) -> MinHashLSH:
+        """LSH index of the section signatures, built on first use."""
+        if self._lsh is None:
+            self._lsh = MinHashLSH.for_threshold(LSH_THRESHOLD)
+            for position, section_id in enumerate(self.ids):
+                self._lsh.insert(section_id, self.signature(position))
+        return self._lsh
+
+    def positions(self, section_ids: Iterable[str]) -> List[int]:
+        """Return the positions of indexed sections, in document order.
+
+        Args:
+            section_ids: IDs of sections in the index
+
+        Returns:
+            List[int]: Sorted positions of the sections
+        """
+        return sorted(self._positions[section_id] for section_id in section_ids)
+
+    def signature(self, position: int) -> np.ndarray:
+        """Return the MinHash signature of the section at a position.
+
+        Args:
+            position: Position of the section in the index
+
+        Returns:
+            np.ndarray: Signature of the section's title and content tokens
+        """
+        return _section_signature(self.titles[position], self.contents[position])
+
+    def update(self, section_id: str, section: DocumentSection) -> None:
+        """Add a section, or replace the one stored under the same ID.
+
+        Args:
+            section_id: Section identifier
+            section: Section as written to the document
+        """
+        title = _normalize(section.title)
+        content = _normalize(section.content)
+        position = self._positions.get(section_id)
+        if position is None:
+            position = self._positions[section_id] = len(self.ids)
+            self.ids.append(section_id)
+            self.titles.append(title)
+            self.contents.append(content)
+        else:
+            self.titles[position] = title
+            self.contents[position] = content
+
+        if self._lsh is not None:
+            self._lsh.insert(section_id, self.signature(position))
 
 
 class TextAnalyzer:
     """Tools for analyzing and comparing text content.
 
     This class provides methods for text similarity calculation and document section
-    management. It uses sequence matching for basic text comparison and AI assistance
-    for more complex merging operations.
+    management. It uses edit-distance scoring for basic text comparison and AI
+    assistance for more complex merging operations.
 
     Attributes:
         openai: OpenAI client instance for AI-assisted operations
+        async_openai: AsyncOpenAI client instance for concurrent AI-assisted operations
+        model: Model used for AI-assisted comparisons and merges
     """
 
-    def __init__(self, openai_client: Optional[OpenAI] = None):
+    def __init__(
+        self,
+        openai_client: Optional[OpenAI] = None,
+        async_openai_client: Optional[AsyncOpenAI] = None,
+        model: str = DEFAULT_MODEL,
+    ):
         """Initialize the text analyzer.
 
         Args:
-            openai_client: Optional OpenAI client. If not provided, will attempt to create
-                         one using environment variables.
+            openai_client: Optional OpenAI client. If not provided, a shared client is
+                         created once per process using environment variables.
+            async_openai_client: Optional AsyncOpenAI client. If not provided, a
+                         client shared per event loop is used.
+            model: Model used for AI-assisted comparisons and merges
 
         Raises:
             ValueError: If OpenAI client creation fails due to missing API key
         """
-        self.openai = openai_client or OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.openai = openai_client or _default_openai()
+        self.model = model
+        self._async_openai = async_openai_client
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        self._request_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._result_cache: OrderedDict[bytes, Tuple[float, BaseModel]] = OrderedDict()
+
+    @property
+    def async_openai(self) -> AsyncOpenAI:
+        """AsyncOpenAI client, shared per event loop unless one was provided."""
+        return self._async_openai or _default_async_openai()
+
+    def _request_limiter(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent async requests.
+
+        A semaphore is tied to the event loop it is first used in, so a new
+        one is created whenever the analyzer is used from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._request_slots_loop is not loop:
+            self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            self._request_slots_loop = loop
+        return self._request_slots
+
+    def _cache_key(
+        self, operation: str, section1: DocumentSection, section2: DocumentSection
+    ) -> bytes:
+        """Build a cache key from the operation, model and both sections.
+
+        Comparisons are symmetric, so both argument orders share a key. Merges
+        are not: the first section's title and ordering take precedence.
+        """
+        half1 = f"{section1.title}\x00{section1.content}"
+        half2 = f"{section2.title}\x00{section2.content}"
+        if operation == "compare" and half2 < half1:
+            half1, half2 = half2, half1
+        payload = "\x01".join((operation, self.model, half1, half2))
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+    def _get_cached_result(self, key: bytes) -> Optional[BaseModel]:
+        """Return a cached result if present and not expired."""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, result = entry
+        if expires_at < time.monotonic():
+            del self._result_cache[key]
+            return None
+
+        self._result_cache.move_to_end(key)
+        return result
+
+    def _cache_result(self, key: bytes, result: BaseModel) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        self._result_cache[key] = (time.monotonic() + RESULT_CACHE_TTL, result)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    def clear_caches(self) -> None:
+        """Release memoized similarity scores, tokens, bigrams and signatures.
+
+        These caches are shared by all analyzers in the process; long-running
+        sessions can call this to reclaim memory.
+        """
+        _pair_similarity.cache_clear()
+        _normalize.cache_clear()
+        _tokens.cache_clear()
+        _text_signature.cache_clear()
+        _bigrams.cache_clear()
+
+    def count_tokens(self, text: str) -> int:
+        """Count the whitespace-separated tokens in a text.
+
+        Args:
+            text: Text to count tokens in
+
+        Returns:
+            int: Number of tokens, shared with the tokenization used for matching
+        """
+        return len(_tokens(text))
 
     def calculate_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two text strings using sequence matching.
+        """Calculate similarity between two text strings using the Indel distance.
+
+        The score is 2 * LCS / (len(text1) + len(text2)), computed with RapidFuzz's
+        bit-parallel implementation.
 
         Args:
             text1: First text string to compare
@@ -59,11 +487,20 @@ class TextAnalyzer:
         """
         if not text1 or not text2:
             return 0.0
+        if text1 == text2:
+            return 1.0
 
-        return SequenceMatcher(None, text1, text2).ratio()
+        # The score is symmetric, so both argument orders share a cache entry
+        if text2 < text1:
+            text1, text2 = text2, text1
+        return _pair_similarity(text1, text2)
 
     def find_most_relevant_section(
-        self, doc: DocumentContent, title: str, content: str
+        self,
+        doc: DocumentContent,
+        title: str,
+        content: str,
+        index: Optional[SectionIndex] = None,
     ) -> Tuple[Optional[str], float]:
         """Find most relevant existing section for given title/content.
 
@@ -71,6 +508,9 @@ class TextAnalyzer:
             doc: Document content containing sections to search through
             title: Title to compare against existing sections
             content: Content to compare against existing sections
+            index: Optional up-to-date index of the document's sections. Avoids
+                rebuilding the column view on every search and lets large
+                documents find candidates without scanning every section.
 
         Returns:
             Tuple containing:
@@ -80,41 +520,106 @@ class TextAnalyzer:
         if not doc.sections:
             return None, 0.0
 
-        max_similarity = 0.0
-        best_section_id = None
+        lsh = None
+        if index is None:
+            index = SectionIndex(doc.sections)
+        elif len(index) > MINHASH_MIN_SECTIONS:
+            lsh = index.lsh
+
+        title = _normalize(title)
+        content = _normalize(content)
+
+        section_ids, titles, contents = index.ids, index.titles, index.contents
+        if len(index) > MINHASH_MIN_SECTIONS:
+            positions = self._minhash_candidates(index, title, content, lsh)
+            section_ids = [section_ids[i] for i in positions]
+            titles = [titles[i] for i in positions]
+            contents = [contents[i] for i in positions]
+
+        # Re-ingested sections are common; an exact match is the best possible
+        # score, so skip scoring altogether.
+        # Membership is checked in C first, so misses never loop in Python.
+        if title and content and content in contents:
+            for section_id, section_title, section_content in zip(
+                section_ids, titles, contents
+            ):
+                if section_content == content and section_title == title:
+                    return section_id, 1.0
 
-        for section_id, section in doc.sections.items():
-            # Calculate similarity based on titles and content
-            title_similarity = self.calculate_similarity(
-                section.title.lower(), title.lower()
+        # Calculate similarity based on titles and content for all sections at once
+        title_scores = _batch_similarity(title, titles)
+
+        # Content bodies dominate the scoring cost. Only sections scoring at
+        # least 0.4 on both fields escape the penalty below, and any of those
+        # beats every penalized section, so score content for plausible titles
+        # first and only fall back to the remaining sections if none qualify.
+        # Within each group, only the closest sections by bigram Dice are
+        # scored; the rest keep a content score of 0.0.
+        content_scores = np.zeros(len(section_ids))
+        plausible = _dice_prefilter(
+            content, np.flatnonzero(title_scores >= 0.4), contents
+        )
+        content_scores[plausible] = _batch_similarity(
+            content, [contents[i] for i in plausible]
+        )
+        if not (content_scores[plausible] >= 0.4).any():
+            remaining = _dice_prefilter(
+                content, np.flatnonzero(title_scores < 0.4), contents
             )
-            content_similarity = self.calculate_similarity(
-                section.content.lower(), content.lower()
+            content_scores[remaining] = _batch_similarity(
+                content, [contents[i] for i in remaining]
             )
 
-            # Use strict thresholds and exponential scaling
-            if title_similarity < 0.4 or content_similarity < 0.4:
-                # If either score is low, severely reduce overall similarity
-                similarity = (
-                    min(title_similarity, content_similarity) * 0.05
-                )  # Even more penalty
-            else:
-                # Weight title matches higher and use exponential scaling
-                title_weight = pow(
-                    title_similarity, 2
-                )  # Square for more aggressive scaling
-                content_weight = pow(
-                    content_similarity, 1.5
-                )  # Less aggressive but still strict
-                base_similarity = (title_weight * 0.6) + (content_weight * 0.4)
-                # Apply additional scaling to push dissimilar content lower
-                similarity = pow(base_similarity, 1.5)
-
-            if similarity > max_similarity:
-                max_similarity = similarity
-                best_section_id = section_id
-
-        return best_section_id, max_similarity
+        # Use strict thresholds and exponential scaling. If either score is low,
+        # severely reduce overall similarity; otherwise weight title matches
+        # higher (squared) than content matches, then push dissimilar content
+        # lower with an additional power.
+        similarities = np.where(
+            (title_scores < 0.4) | (content_scores < 0.4),
+            np.minimum(title_scores, content_scores) * 0.05,
+            (title_scores**2 * 0.6 + content_scores**1.5 * 0.4) ** 1.5,
+        )
+
+        # argmax returns the first of equally good sections
+        best = int(similarities.argmax())
+        if similarities[best] <= 0.0:
+            return None, 0.0
+        return section_ids[best], float(similarities[best])
+
+    def _minhash_candidates(
+        self,
+        index: SectionIndex,
+        title: str,
+        content: str,
+        lsh: Optional[MinHashLSH] = None,
+    ) -> List[int]:
+        """Select the sections whose token sets best overlap the given text.
+
+        Args:
+            index: Index of the sections to choose candidates from
+            title: Title to compare against existing sections
+            content: Content to compare against existing sections
+            lsh: Optional LSH index of the sections, keyed by section ID
+
+        Returns:
+            Positions of up to MINHASH_CANDIDATES sections in the index, in order
+        """
+        query = _section_signature(title, content)
+        positions = range(len(index))
+        if lsh is not None:
+            candidates = lsh.query(query)
+            if candidates:
+                positions = index.positions(candidates)
+
+        if len(positions) > MINHASH_CANDIDATES:
+            signatures = np.stack([index.signature(i) for i in positions])
+            estimates = jaccard_estimates(signatures, query)
+            top = np.sort(
+                np.argpartition(-estimates, MINHASH_CANDIDATES)[:MINHASH_CANDIDATES]
+            )
+            positions = [positions[i] for i in top]
+
+        return list(positions)
 
     def compare_sections(
         self, section1: DocumentSection, section2: DocumentSection
@@ -128,25 +633,111 @@ class TextAnalyzer:
         Returns:
             ComparisonResult containing similarity score and explanation
         """
+        cache_key = self._cache_key("compare", section1, section2)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Try to get AI-based comparison first
             response = self.openai.responses.parse(
                 text_format=ComparisonResult,
-                model="gpt-4-turbo-preview",
-                input=[
-                    {
-                        "role": "user",
-                        "content": f"Compare these two document sections:\n\nSection 1 ({section1.title}):\n{section1.content}\n\nSection 2 ({section2.title}):\n{section2.content}",
-                    }
-                ],
+                model=self.model,
+                temperature=0,
+                input=self._compare_input(section1, section2),
             )
+            self._cache_result(cache_key, response.output_parsed)
             return response.output_parsed
         except Exception as e:
             # On error, return 0 similarity
-            return ComparisonResult(
-                similarity_score=0.0,
-                explanation=f"Failed to compare sections: {str(e)}",
-            )
+            return _failed_comparison(e)
+
+    async def compare_sections_async(
+        self, section1: DocumentSection, section2: DocumentSection
+    ) -> ComparisonResult:
+        """Compare two document sections using the async OpenAI client.
+
+        Args:
+            section1: First section to compare
+            section2: Second section to compare
+
+        Returns:
+            ComparisonResult containing similarity score and explanation
+        """
+        cache_key = self._cache_key("compare", section1, section2)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            async with self._request_limiter():
+                response = await self.async_openai.responses.parse(
+                    text_format=ComparisonResult,
+                    model=self.model,
+                    temperature=0,
+                    input=self._compare_input(section1, section2),
+                )
+            self._cache_result(cache_key, response.output_parsed)
+            return response.output_parsed
+        except Exception as e:
+            # On error, return 0 similarity
+            return _failed_comparison(e)
+
+    async def compare_sections_batch(
+        self, pairs: List[Tuple[DocumentSection, DocumentSection]]
+    ) -> List[ComparisonResult]:
+        """Compare many pairs of document sections concurrently.
+
+        Duplicate pairs are only sent to the API once.
+
+        Args:
+            pairs: Pairs of sections to compare
+
+        Returns:
+            List of ComparisonResult objects in the same order as the pairs
+        """
+        unique, positions = self._unique_pairs("compare", pairs)
+        results = await asyncio.gather(
+            *(self.compare_sections_async(s1, s2) for s1, s2 in unique)
+        )
+        return [results[i] for i in positions]
+
+    def _unique_pairs(
+        self, operation: str, pairs: List[Tuple[DocumentSection, DocumentSection]]
+    ) -> Tuple[List[Tuple[DocumentSection, DocumentSection]], List[int]]:
+        """Drop pairs that would produce the same cached result.
+
+        Args:
+            operation: Operation the pairs are passed to
+            pairs: Pairs of sections
+
+        Returns:
+            Tuple of (unique pairs in first-seen order, position in the unique
+            pairs of each input pair)
+        """
+        seen: Dict[bytes, int] = {}
+        unique = []
+        positions = []
+        for section1, section2 in pairs:
+            key = self._cache_key(operation, section1, section2)
+            if key not in seen:
+                seen[key] = len(unique)
+                unique.append((section1, section2))
+            positions.append(seen[key])
+        return unique, positions
+
+    def _compare_input(
+        self, section1: DocumentSection, section2: DocumentSection
+    ) -> List[Dict[str, str]]:
+        """Build the model input for comparing two sections."""
+        return [
+            {
+                "role": "user",
+                "content": _COMPARE_PROMPT(
+                    section1.title, section1.content, section2.title, section2.content
+                ),
+            }
+        ]
 
     def merge_sections(
         self, section1: DocumentSection, section2: DocumentSection
@@ -160,23 +751,180 @@ class TextAnalyzer:
         Returns:
             MergeResult containing merged title, content, and source sections
         """
+        cache_key = self._cache_key("merge", section1, section2)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Try AI-assisted merge first
             response = self.openai.responses.parse(
                 text_format=MergeResult,
-                model="gpt-4-turbo-preview",
-                input=[
-                    {
-                        "role": "user",
-                        "content": f"Merge these two document sections into a unified section:\n\nSection 1 ({section1.title}):\n{section1.content}\n\nSection 2 ({section2.title}):\n{section2.content}",
-                    }
-                ],
+                model=self.model,
+                temperature=0,
+                input=self._merge_input(section1, section2),
             )
+            self._cache_result(cache_key, response.output_parsed)
+            return response.output_parsed
+        except Exception as e:
+            # On error, keep the first section's content
+            return _fallback_merge(section1)
+
+    async def merge_sections_async(
+        self, section1: DocumentSection, section2: DocumentSection
+    ) -> MergeResult:
+        """Merge two document sections using the async OpenAI client.
+
+        Args:
+            section1: First document section to merge
+            section2: Second document section to merge
+
+        Returns:
+            MergeResult containing merged title, content, and source sections
+        """
+        cache_key = self._cache_key("merge", section1, section2)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            async with self._request_limiter():
+                response = await self.async_openai.responses.parse(
+                    text_format=MergeResult,
+                    model=self.model,
+                    temperature=0,
+                    input=self._merge_input(section1, section2),
+                )
+            self._cache_result(cache_key, response.output_parsed)
             return response.output_parsed
         except Exception as e:
             # On error, keep the first section's content
-            return MergeResult(
-                merged_title=section1.title,
-                merged_content=section1.content,
-                source_sections=[section1.title],
+            return _fallback_merge(section1)
+
+    async def merge_sections_stream(
+        self, section1: DocumentSection, section2: DocumentSection
+    ) -> AsyncIterator[MergeResultDelta]:
+        """Merge two document sections, yielding output as it is generated.
+
+        Args:
+            section1: First document section to merge
+            section2: Second document section to merge
+
+        Yields:
+            MergeResultDelta updates carrying raw output fragments. The last
+            update carries the parsed MergeResult; cached results are yielded
+            as a single final update.
+        """
+        cache_key = self._cache_key("merge", section1, section2)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            yield MergeResultDelta(result=cached)
+            return
+
+        # The request runs in its own task and hands updates over through a
+        # queue, so its request slot is released when the response ends even
+        # if the caller stops iterating early.
+        updates: asyncio.Queue = asyncio.Queue()
+
+        async def stream_merge():
+            try:
+                async with self._request_limiter():
+                    async with self.async_openai.responses.stream(
+                        text_format=MergeResult,
+                        model=self.model,
+                        temperature=0,
+                        input=self._merge_input(section1, section2),
+                    ) as stream:
+                        async for event in stream:
+                            if event.type == "response.output_text.delta":
+                                updates.put_nowait(MergeResultDelta(delta=event.delta))
+                        response = await stream.get_final_response()
+                result = response.output_parsed
+                self._cache_result(cache_key, result)
+            except Exception as e:
+                # On error, keep the first section's content
+                result = _fallback_merge(section1)
+            updates.put_nowait(MergeResultDelta(result=result))
+
+        task = asyncio.create_task(stream_merge())
+        try:
+            while True:
+                update = await updates.get()
+                yield update
+                if update.result is not None:
+                    return
+        finally:
+            # Closing the generator early abandons the request
+            task.cancel()
+
+    async def merge_sections_batch(
+        self, pairs: List[Tuple[DocumentSection, DocumentSection]]
+    ) -> List[MergeResult]:
+        """Merge many pairs of document sections concurrently.
+
+        Duplicate pairs are only sent to the API once, and the remaining pairs
+        are sent in chunks of MERGE_BATCH_SIZE concurrent requests.
+
+        Args:
+            pairs: Pairs of sections to merge
+
+        Returns:
+            List of MergeResult objects in the same order as the pairs
+        """
+        unique, positions = self._unique_pairs("merge", pairs)
+        results: List[MergeResult] = []
+        for start in range(0, len(unique), MERGE_BATCH_SIZE):
+            chunk = unique[start : start + MERGE_BATCH_SIZE]
+            results.extend(
+                await asyncio.gather(
+                    *(self.merge_sections_async(s1, s2) for s1, s2 in chunk)
+                )
             )
+        return [results[i] for i in positions]
+
+    def _merge_input(
+        self, section1: DocumentSection, section2: DocumentSection
+    ) -> List[Dict[str, str]]:
+        """Build the model input for merging two sections."""
+        return [
+            {
+                "role": "user",
+                "content": _MERGE_PROMPT(
+                    section1.title, section1.content, section2.title, section2.content
+                ),
+            }
+        ]
+
+    def deterministic_merge(
+        self, section1: DocumentSection, section2: DocumentSection
+    ) -> Optional[MergeResult]:
+        """Merge two highly overlapping sections without AI assistance.
+
+        Paragraphs are aligned with a longest common subsequence, so shared
+        paragraphs appear once and every other paragraph keeps its position
+        relative to them. Paragraphs edited in the incoming section replace
+        their existing version.
+
+        A local merge is only safe when one section's paragraphs all appear in
+        the other; otherwise both sections changed in ways only a model can
+        reconcile.
+
+        Args:
+            section1: Existing document section
+            section2: Incoming document section
+
+        Returns:
+            MergeResult containing merged title, content, and source sections,
+            or None if neither section's paragraphs are all found in the other
+        """
+        paragraphs1 = _paragraphs(section1.content)
+        paragraphs2 = _paragraphs(section2.content)
+        merged, matched = _merge_paragraphs(paragraphs1, paragraphs2)
+        if matched < min(len(paragraphs1), len(paragraphs2)):
+            return None
+
+        return MergeResult.model_construct(
+            merged_title=section1.title,
+            merged_content="\n\n".join(merged),
+            source_sections=[section1.title, section2.title],
+        )
@@ -2,7 +2,7 @@
 set -e
 
 echo "Running unit tests..."
-pytest tests/ -v --cov=edison
+EDISON_RUN_SLOW=1 pytest tests/ -v --cov=edison
 
 echo -e "\nRunning e2e tests..."
 pytest e2e/ -v
@@ -17,12 +17,19 @@ setup(
         "openai>=1.61.1",
         "openai-agents>=0.0.11",
         "argparse>=1.4.0",
+        "numpy>=1.24.0",
+        "rapidfuzz>=3.0.0",
+        "orjson>=3.8.0",
     ],
     extras_require={
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
         ],
+        "fast": [
+            "numba>=0.58.0",
+            "h2>=4.0.0",
+        ],
     },
     author="Aditya Patange (AdiPat)",
     author_email="contact.adityapatange@gmail.com",
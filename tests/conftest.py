@@ -0,0 +1,27 @@
+"""Shared pytest configuration."""
+
+import os
+import tempfile
+
+import pytest
+
+# Keep temporary test files in memory when a tmpfs is available, unless the
+# caller chose a temporary directory explicitly.
+if "TMPDIR" not in os.environ and os.access("/dev/shm", os.W_OK):
+    os.environ["TMPDIR"] = "/dev/shm"
+    tempfile.tempdir = None
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow unless they were asked for.
+
+    Slow tests run when EDISON_RUN_SLOW is set or when they are selected
+    explicitly with a marker expression such as ``-m slow``.
+    """
+    if os.environ.get("EDISON_RUN_SLOW") or "slow" in config.option.markexpr:
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow test; set EDISON_RUN_SLOW=1 to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -0,0 +1,51 @@
+"""Helpers shared by the tools tests."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from edison.models import ComparisonResult, MergeResult
+
+FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+DEFAULT_COMPARE = ComparisonResult(
+    similarity_score=0.9,
+    explanation="The sections are nearly identical with minor wording differences.",
+)
+METHODOLOGY_MERGE = MergeResult(
+    merged_title="Research Methodology",
+    merged_content="1. First step (Initial phase)\n2. Second step (Second phase)",
+    source_sections=["Methods", "Methodology"],
+)
+
+
+def parsed_response(parsed):
+    """Builds a minimal stand-in for a parsed OpenAI response."""
+    return SimpleNamespace(output_parsed=parsed)
+
+
+def assert_compare_call(mock_openai, section_a, section_b, invoker):
+    """Runs a comparison through invoker and checks the request sent to OpenAI.
+
+    Args:
+        mock_openai: Mocked OpenAI client used by invoker
+        section_a: First section to compare
+        section_b: Second section to compare
+        invoker: Callable comparing two sections through the mocked client
+
+    Returns:
+        Tuple of (the ComparisonResult served by the mock, invoker's result)
+    """
+    mock_result = DEFAULT_COMPARE
+    mock_openai.responses.parse.return_value = parsed_response(mock_result)
+
+    result = invoker(section_a, section_b)
+
+    mock_openai.responses.parse.assert_called_once()
+    kwargs = mock_openai.responses.parse.call_args.kwargs
+    prompt = kwargs["input"][0]["content"]
+    assert kwargs["model"] == "gpt-4o-mini"
+    assert kwargs["temperature"] == 0
+    assert kwargs["text_format"] == ComparisonResult
+    assert "Compare these two document sections" in prompt
+    assert section_a.title in prompt
+    assert section_b.title in prompt
+    return mock_result, result
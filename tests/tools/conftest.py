@@ -0,0 +1,76 @@
+"""Fixtures shared by the tools tests."""
+
+import re
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from edison.models import DocumentSection
+from edison.tools.text_tools import TextAnalyzer
+from ._shared import FIXED_NOW
+
+
+@pytest.fixture
+def mock_openai():
+    """Provides a fresh mocked OpenAI client for each test."""
+    client = MagicMock()
+    client.responses.parse = MagicMock()
+    return client
+
+
+@pytest.fixture
+def async_analyzer(mock_openai):
+    """Provides a TextAnalyzer with its own mocked AsyncOpenAI client.
+
+    Returns:
+        Tuple of (analyzer, mocked async client)
+    """
+    async_client = MagicMock()
+    analyzer = TextAnalyzer(openai_client=mock_openai, async_openai_client=async_client)
+    return analyzer, async_client
+
+
+@pytest.fixture(scope="session")
+def _now():
+    """Provides a fixed timestamp for sample sections."""
+    return FIXED_NOW
+
+
+@pytest.fixture(scope="session")
+def sample_sections(_now):
+    """Provides sample sections shared by the AI comparison and merge tests."""
+    return SimpleNamespace(
+        intro=DocumentSection(
+            title="Introduction",
+            content="This is an introduction.",
+            last_modified=_now,
+        ),
+        intro_short=DocumentSection(
+            title="Intro", content="This is an intro.", last_modified=_now
+        ),
+        methods=DocumentSection(
+            title="Methods",
+            content="1. First step\n2. Second step",
+            last_modified=_now,
+        ),
+        methodology=DocumentSection(
+            title="Methodology",
+            content="1. Initial phase\n2. Second phase",
+            last_modified=_now,
+        ),
+        test_1=DocumentSection(title="Test", content="Content 1", last_modified=_now),
+        test_2=DocumentSection(title="Test", content="Content 2", last_modified=_now),
+    )
+
+
+@pytest.fixture(scope="session")
+def _storage_base(tmp_path_factory):
+    """Provides the base directory shared by all storage directories."""
+    return tmp_path_factory.mktemp("docs")
+
+
+@pytest.fixture
+def storage_dir(_storage_base, request):
+    """Provides a per-test storage directory under the shared base."""
+    return str(_storage_base / re.sub(r"\W", "_", request.node.name))
@@ -12,15 +12,15 @@ from edison.errors import StorageError, StorageIOError
 
 
 @pytest.fixture
-def storage_dir(tmp_path):
+def storage_path(tmp_path):
     """Provides a temporary directory for storage tests."""
     return str(tmp_path / "test_documents")
 
 
 @pytest.fixture
-def storage(storage_dir):
+def storage(storage_path):
     """Returns a DocumentStorage instance with temp directory."""
-    return DocumentStorage(storage_dir)
+    return DocumentStorage(storage_path)
 
 
 @pytest.fixture
@@ -221,3 +221,81 @@ def test_load_document_with_partial_data(storage):
     assert loaded_doc.sections == {}
     assert loaded_doc.metadata == []
     assert loaded_doc.version == 1
+
+
+def test_save_section_and_manifest(storage, sample_document):
+    """Test incremental section saves are merged with the document on load."""
+    doc_id = "test_incremental"
+    storage.save_document(doc_id, sample_document)
+
+    sample_document.sections["methods"] = DocumentSection(
+        title="Methods",
+        content="Method content",
+        last_modified=datetime(2024, 1, 2),
+        version=0,
+        context_tokens=2,
+    )
+    storage.save_section(doc_id, "methods", sample_document.sections["methods"])
+    storage.save_manifest(doc_id, sample_document)
+
+    with (Path(storage.storage_dir) / f"{doc_id}.json").open() as f:
+        saved_data = json.load(f)
+    assert saved_data["section_ids"] == ["intro", "methods"]
+    assert saved_data["sections"] == {}
+    assert (Path(storage.storage_dir) / f"{doc_id}.sections" / "intro.json").exists()
+
+    loaded_doc = storage.load_document(doc_id)
+    assert list(loaded_doc.sections) == ["intro", "methods"]
+    assert loaded_doc.sections["intro"].content == "Test content"
+    assert loaded_doc.sections["methods"].content == "Method content"
+
+
+def test_save_manifest_writes_each_section_once(storage, sample_document):
+    """Test later manifests only reference sections that already have a file."""
+    doc_id = "test_manifest_once"
+    storage.save_document(doc_id, sample_document)
+    storage.save_manifest(doc_id, sample_document)
+
+    with patch.object(storage, "save_section") as save_section:
+        storage.save_manifest(doc_id, sample_document)
+    save_section.assert_not_called()
+
+    # A fresh storage learns which sections have files when loading
+    reloaded = DocumentStorage(storage.storage_dir)
+    loaded_doc = reloaded.load_document(doc_id)
+    with patch.object(reloaded, "save_section") as save_section:
+        reloaded.save_manifest(doc_id, loaded_doc)
+    save_section.assert_not_called()
+
+
+def test_save_document_folds_in_saved_sections(storage, sample_document):
+    """Test a full save replaces individually saved sections."""
+    doc_id = "test_fold"
+    storage.save_section(
+        doc_id,
+        "intro",
+        DocumentSection(title="Introduction", content="Stale content"),
+    )
+    storage.save_manifest(doc_id, sample_document)
+    storage.save_document(doc_id, sample_document)
+
+    assert not (Path(storage.storage_dir) / f"{doc_id}.sections").exists()
+    loaded_doc = storage.load_document(doc_id)
+    assert loaded_doc.sections["intro"].content == "Test content"
+
+
+def test_load_all(storage, sample_document):
+    """Test loading all documents skips corrupted files."""
+    storage.save_document("doc1", sample_document)
+    storage.save_document("doc2", sample_document)
+    with (Path(storage.storage_dir) / "corrupt.json").open("w") as f:
+        f.write("invalid json")
+
+    docs = storage.load_all()
+    assert sorted(docs) == ["doc1", "doc2"]
+    assert docs["doc1"].sections["intro"].title == "Introduction"
+
+
+def test_load_all_empty(storage):
+    """Test loading all documents from an empty directory."""
+    assert storage.load_all() == {}
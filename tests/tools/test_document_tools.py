@@ -1,10 +1,13 @@
 """Tests for document management tools."""
 
+import asyncio
+import hashlib
+import json
 import pytest
-from datetime import datetime
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from pathlib import Path
 from edison.tools.document_tools import DocumentWriterTool
+from ._shared import METHODOLOGY_MERGE, assert_compare_call, parsed_response
 from edison.models import (
     DocumentContent,
     DocumentSection,
@@ -14,36 +17,72 @@ from edison.models import (
 )
 from edison.errors import DocumentNotFoundError
 
+_DEFAULT_MERGE = MergeResult(
+    merged_title="Test Section",
+    merged_content="This is test content",
+    source_sections=["section_1"],
+)
+
 
 @pytest.fixture
-def mock_openai():
-    """Provides a mocked OpenAI client."""
-    with patch("openai.OpenAI") as mock:
-        client = MagicMock()
-        mock.return_value = client
-
-        # Mock the responses.parse method
-        parse_response = MagicMock()
-        parse_response.output_parsed = MergeResult(
-            merged_title="Test Section",
-            merged_content="This is test content",
-            source_sections=["section_1"],
-        )
-        client.responses.parse = MagicMock(return_value=parse_response)
+def doc_mock_openai(mock_openai):
+    """Provides the mocked OpenAI client, returning a merge result by default."""
+    mock_openai.responses.parse.return_value = parsed_response(_DEFAULT_MERGE)
+    return mock_openai
+
 
-        yield client
+def _parse_key(model_input):
+    """Derives the cache key of a responses.parse input."""
+    return hashlib.blake2b(json.dumps(model_input, sort_keys=True).encode()).hexdigest()
 
 
 @pytest.fixture
-def storage_dir(tmp_path):
-    """Provides a temporary directory for storage tests."""
-    return str(tmp_path / "test_documents")
+def cached_parse(doc_mock_openai):
+    """Serves canned parse results by prompt; returns the prompt key map."""
+    responses = {}
+    doc_mock_openai.responses.parse.side_effect = lambda **kwargs: responses[
+        _parse_key(kwargs["input"])
+    ]
+    return responses
+
+
+def _expect_merge(cached_parse, document_tool, title, existing, incoming):
+    """Registers the merged result for merging incoming into existing content."""
+    model_input = document_tool.text_analyzer._merge_input(
+        DocumentSection(title=title, content=existing),
+        DocumentSection(title=title, content=incoming),
+    )
+    cached_parse[_parse_key(model_input)] = parsed_response(
+        MergeResult(
+            merged_title=title, merged_content=incoming, source_sections=["section_1"]
+        )
+    )
 
 
 @pytest.fixture
-def document_tool(storage_dir, mock_openai):
+def document_tool(storage_dir, doc_mock_openai):
     """Provides a DocumentWriterTool instance with mocked OpenAI."""
-    return DocumentWriterTool(storage_dir=storage_dir, openai_client=mock_openai)
+    return DocumentWriterTool(storage_dir=storage_dir, openai_client=doc_mock_openai)
+
+
+@pytest.fixture(scope="module")
+def _readonly_tool(tmp_path_factory):
+    """Provides one DocumentWriterTool for the whole module."""
+    return DocumentWriterTool(
+        storage_dir=str(tmp_path_factory.mktemp("readonly_docs")),
+        openai_client=MagicMock(),
+    )
+
+
+@pytest.fixture
+def readonly_document_tool(_readonly_tool, doc_mock_openai):
+    """Provides the shared DocumentWriterTool using this test's mocked client.
+
+    Tests requesting this fixture must not create or update documents.
+    """
+    _readonly_tool.text_analyzer.openai = doc_mock_openai
+    _readonly_tool.text_analyzer._result_cache.clear()
+    return _readonly_tool
 
 
 def test_create_document(document_tool):
@@ -69,16 +108,13 @@ def test_get_document(document_tool):
         document_tool.get_document("nonexistent")
 
 
-def test_update_section(document_tool, mock_openai):
+def test_update_section(document_tool, cached_parse):
     """Test section updates."""
     doc_id = "test_doc"
     title = "Test Section"
     content = "This is test content"
-
-    # Configure mock response specifically for this test
-    mock_openai.responses.parse.return_value.output_parsed = MergeResult(
-        merged_title=title, merged_content=content, source_sections=["section_1"]
-    )
+    new_content = "This is a text content with updates"
+    _expect_merge(cached_parse, document_tool, title, content, new_content)
 
     # Test creating new section
     section = document_tool.update_section(doc_id, title, content)
@@ -86,18 +122,13 @@ def test_update_section(document_tool, mock_openai):
     assert section.content == content
     assert section.version == 0
 
-    # Configure mock response for update
-    new_content = "This is a text content with updates"
-    mock_openai.responses.parse.return_value.output_parsed = MergeResult(
-        merged_title=title, merged_content=new_content, source_sections=["section_1"]
-    )
-
     # Test updating existing section
     updated = document_tool.update_section(doc_id, title, new_content)
     assert updated.content == new_content
     assert updated.version == 1
 
 
+@pytest.mark.slow
 def test_markdown_generation(document_tool):
     """Test markdown file generation."""
     doc_id = "test_doc"
@@ -111,64 +142,51 @@ def test_markdown_generation(document_tool):
     )
 
     # Check markdown file creation
+    document_tool.flush()
     markdown_path = Path(document_tool.storage_dir) / f"{doc_id}.md"
-    assert markdown_path.exists()
+    try:
+        content = markdown_path.read_text()
+    except FileNotFoundError:
+        pytest.fail(f"{markdown_path} was not created")
 
     # Verify content
-    content = markdown_path.read_text()
     assert "## Introduction" in content
     assert "## Methods" in content
     assert "# Welcome" in content
     assert "1. First step" in content
 
 
-@pytest.mark.parametrize(
-    "doc_id,title,content",
-    [
-        ("", "Title", "Content"),  # Empty doc_id
-        ("doc", "", "Content"),  # Empty title
-        ("doc", "Title", ""),  # Empty content
-    ],
-)
-def test_edge_cases(document_tool, doc_id, title, content):
+def test_edge_cases(document_tool):
     """Test edge cases with empty or invalid inputs."""
-    section = document_tool.update_section(doc_id, title, content)
-    assert section is not None
-    assert section.title == title
-    assert section.content == content
+    cases = [
+        ("", "Title", "Content"),  # Empty doc_id
+        ("doc_empty_title", "", "Content"),  # Empty title
+        ("doc_empty_content", "Title", ""),  # Empty content
+    ]
+    for doc_id, title, content in cases:
+        section = document_tool.update_section(doc_id, title, content)
+        assert section is not None
+        assert section.title == title
+        assert section.content == content
 
 
-def test_concurrent_updates(document_tool, mock_openai):
+def test_concurrent_updates(document_tool, cached_parse):
     """Test handling multiple updates to same section."""
     doc_id = "test_doc"
     title = "Test Section"
+    _expect_merge(cached_parse, document_tool, title, "Initial content", "Update 1")
+    _expect_merge(cached_parse, document_tool, title, "Update 1", "Update 2")
 
-    # Configure mock response for initial section
-    mock_openai.responses.parse.return_value.output_parsed = MergeResult(
-        merged_title=title,
-        merged_content="Initial content",
-        source_sections=["section_1"],
-    )
-
-    # Create initial section
+    # Create initial section, then update it twice
     document_tool.update_section(doc_id, title, "Initial content")
-
-    # Configure mock for first update
-    mock_openai.responses.parse.return_value.output_parsed = MergeResult(
-        merged_title=title, merged_content="Update 1", source_sections=["section_1"]
-    )
     section1 = document_tool.update_section(doc_id, title, "Update 1")
-
-    # Configure mock for second update
-    mock_openai.responses.parse.return_value.output_parsed = MergeResult(
-        merged_title=title, merged_content="Update 2", source_sections=["section_1"]
-    )
     section2 = document_tool.update_section(doc_id, title, "Update 2")
 
     assert section2.version > section1.version
     assert section2.content == "Update 2"
 
 
+@pytest.mark.slow
 def test_special_characters(document_tool):
     """Test handling of special characters in content."""
     doc_id = "test_doc"
@@ -183,71 +201,41 @@ def test_special_characters(document_tool):
     assert section.content == content
 
     # Verify markdown file handles special chars
+    document_tool.flush()
     markdown_path = Path(document_tool.storage_dir) / f"{doc_id}.md"
-    assert markdown_path.exists()
-    saved_content = markdown_path.read_text()
+    try:
+        saved_content = markdown_path.read_text()
+    except FileNotFoundError:
+        pytest.fail(f"{markdown_path} was not created")
     assert "🚀" in saved_content
     assert "é" in saved_content
 
 
-def test_section_comparison_with_ai(document_tool, mock_openai):
+def test_section_comparison_with_ai(
+    readonly_document_tool, doc_mock_openai, sample_sections
+):
     """Test section comparison using OpenAI."""
-    section1 = DocumentSection(
-        title="Introduction",
-        content="This is an introduction.",
-        last_modified=datetime.now(),
-    )
-    section2 = DocumentSection(
-        title="Intro",
-        content="This is an intro.",
-        last_modified=datetime.now(),
-    )
-
-    # Configure mock response for comparison
-    mock_result = ComparisonResult(
-        similarity_score=0.9,
-        explanation="The sections contain very similar content with minor wording differences.",
+    mock_result, (score, explanation) = assert_compare_call(
+        doc_mock_openai,
+        sample_sections.intro,
+        sample_sections.intro_short,
+        readonly_document_tool._compare_sections_with_ai,
     )
-    parse_response = MagicMock()
-    parse_response.output_parsed = mock_result
-    mock_openai.responses.parse.return_value = parse_response
-
-    score, explanation = document_tool._compare_sections_with_ai(section1, section2)
-    assert score == 0.9
-    assert "very similar content" in explanation
-
-    # Verify OpenAI was called with correct parameters
-    call_args = mock_openai.responses.parse.call_args[1]
-    assert call_args["text_format"] == ComparisonResult
-    assert "Compare these two document sections" in call_args["input"][0]["content"]
-    assert section1.title in call_args["input"][0]["content"]
-    assert section2.title in call_args["input"][0]["content"]
+    assert score == mock_result.similarity_score
+    assert explanation == mock_result.explanation
 
 
-def test_section_merging_with_ai(document_tool, mock_openai):
+def test_section_merging_with_ai(
+    readonly_document_tool, doc_mock_openai, sample_sections
+):
     """Test section merging using OpenAI."""
-    section1 = DocumentSection(
-        title="Methods",
-        content="1. First step\n2. Second step",
-        last_modified=datetime.now(),
-    )
-    section2 = DocumentSection(
-        title="Methodology",
-        content="1. Initial phase\n2. Second phase",
-        last_modified=datetime.now(),
-    )
+    section1 = sample_sections.methods
+    section2 = sample_sections.methodology
 
     # Configure mock response for merging
-    mock_result = MergeResult(
-        merged_title="Research Methodology",
-        merged_content="1. First step (Initial phase)\n2. Second step (Second phase)",
-        source_sections=["Methods", "Methodology"],
-    )
-    parse_response = MagicMock()
-    parse_response.output_parsed = mock_result
-    mock_openai.responses.parse.return_value = parse_response
+    doc_mock_openai.responses.parse.return_value = parsed_response(METHODOLOGY_MERGE)
 
-    merged_title, merged_content = document_tool._merge_sections_with_ai(
+    merged_title, merged_content = readonly_document_tool._merge_sections_with_ai(
         section1, section2
     )
     assert merged_title == "Research Methodology"
@@ -255,35 +243,246 @@ def test_section_merging_with_ai(document_tool, mock_openai):
     assert "Second phase" in merged_content
 
     # Verify OpenAI was called with correct parameters
-    call_args = mock_openai.responses.parse.call_args[1]
-    assert call_args["text_format"] == MergeResult
-    assert "Merge these two document sections" in call_args["input"][0]["content"]
-    assert section1.title in call_args["input"][0]["content"]
-    assert section2.title in call_args["input"][0]["content"]
-
-
-def test_invalid_ai_response_handling(document_tool, mock_openai):
+    doc_mock_openai.responses.parse.assert_called_once()
+    kwargs = doc_mock_openai.responses.parse.call_args.kwargs
+    prompt = kwargs["input"][0]["content"]
+    assert kwargs["text_format"] == MergeResult
+    assert "Merge these two document sections" in prompt
+    assert section1.title in prompt
+    assert section2.title in prompt
+
+
+def test_invalid_ai_response_handling(
+    readonly_document_tool, doc_mock_openai, sample_sections
+):
     """Test handling of invalid AI responses."""
-    section1 = DocumentSection(
-        title="Test",
-        content="Content 1",
-        last_modified=datetime.now(),
-    )
-    section2 = DocumentSection(
-        title="Test",
-        content="Content 2",
-        last_modified=datetime.now(),
-    )
+    section1 = sample_sections.test_1
+    section2 = sample_sections.test_2
 
     # Test API error
-    mock_openai.responses.parse.side_effect = Exception("API Error")
+    doc_mock_openai.responses.parse.side_effect = Exception("API Error")
 
     # Should handle error gracefully for comparison
-    score, explanation = document_tool._compare_sections_with_ai(section1, section2)
+    score, explanation = readonly_document_tool._compare_sections_with_ai(
+        section1, section2
+    )
     assert score == 0.0
     assert "Failed to compare sections" in explanation
 
     # Should handle error gracefully for merging
-    title, content = document_tool._merge_sections_with_ai(section1, section2)
+    title, content = readonly_document_tool._merge_sections_with_ai(section1, section2)
     assert title == section1.title
     assert content == section1.content
+
+
+def test_update_section_near_identical_skips_ai(document_tool, doc_mock_openai):
+    """Test near-identical updates are merged without calling OpenAI."""
+    doc_id = "test_doc"
+    title = "Test Section"
+    content = "This is test content"
+
+    document_tool.update_section(doc_id, title, content)
+    updated = document_tool.update_section(doc_id, title, content)
+
+    assert updated.content == content
+    assert updated.version == 1
+    doc_mock_openai.responses.parse.assert_not_called()
+
+
+def test_update_section_single_paragraph_edit(document_tool, doc_mock_openai):
+    """Test a one-word edit replaces the paragraph instead of repeating it."""
+    doc_id = "test_doc"
+    title = "Results"
+    document_tool.update_section(
+        doc_id, title, "Our model reaches 91% accuracy on the held-out benchmark."
+    )
+    updated = document_tool.update_section(
+        doc_id, title, "Our model reaches 92% accuracy on the held-out benchmark."
+    )
+
+    assert updated.content == (
+        "Our model reaches 92% accuracy on the held-out benchmark."
+    )
+    doc_mock_openai.responses.parse.assert_not_called()
+
+
+def test_update_section_diverging_paragraphs_use_ai(document_tool, doc_mock_openai):
+    """Test near-identical updates that replace a paragraph are merged by the model."""
+    doc_id = "test_doc"
+    title = "Test Section"
+    shared = (
+        "This is test content describing the evaluation setup, the datasets we "
+        "used and how every model was trained."
+    )
+    document_tool.update_section(doc_id, title, f"{shared}\n\nOld remark.")
+    updated = document_tool.update_section(doc_id, title, f"{shared}\n\nNew note.")
+
+    doc_mock_openai.responses.parse.assert_called_once()
+    assert updated.content == "This is test content"
+
+
+def test_updates_persist_across_instances(document_tool, storage_dir, doc_mock_openai):
+    """Test incrementally saved sections are reloaded by a new tool."""
+    doc_id = "test_doc"
+    document_tool.update_section(doc_id, "Introduction", "Welcome to the intro.")
+    document_tool.update_section(doc_id, "Methods", "1. First step")
+    document_tool.update_section(doc_id, "Methods", "1. First step")
+
+    reloaded = DocumentWriterTool(
+        storage_dir=storage_dir, openai_client=doc_mock_openai
+    )
+    doc = reloaded.get_document(doc_id)
+    assert list(doc.sections) == ["section_1", "section_2"]
+    assert doc.sections["section_2"].title == "Methods"
+    assert doc.sections["section_2"].version == 1
+    assert doc.version == 3
+
+
+@pytest.mark.slow
+def test_markdown_writes_are_coalesced(document_tool):
+    """Test bursts of updates are written to markdown once, after a delay."""
+    doc_id = "test_doc"
+    markdown_path = Path(document_tool.storage_dir) / f"{doc_id}.md"
+
+    with patch.object(
+        document_tool, "_write_markdown", wraps=document_tool._write_markdown
+    ) as write_markdown:
+        document_tool.update_section(doc_id, "Introduction", "Welcome.")
+        document_tool.update_section(doc_id, "Methods", "1. First step")
+        assert not markdown_path.exists()
+
+        document_tool.flush()
+        write_markdown.assert_called_once()
+
+    assert "## Methods" in markdown_path.read_text()
+    assert not markdown_path.with_name(f"{doc_id}.md.tmp").exists()
+
+
+@pytest.mark.slow
+def test_markdown_written_after_delay(document_tool):
+    """Test scheduled markdown writes happen without an explicit flush."""
+    doc_id = "test_doc"
+
+    with patch("edison.tools.document_tools.MARKDOWN_FLUSH_DELAY", 0.01):
+        document_tool.update_section(doc_id, "Introduction", "Welcome.")
+        timer = document_tool._markdown_timer
+    timer.join()
+
+    markdown_path = Path(document_tool.storage_dir) / f"{doc_id}.md"
+    assert "## Introduction" in markdown_path.read_text()
+
+
+@pytest.mark.slow
+def test_failed_markdown_write_stays_pending(document_tool):
+    """Test a document whose markdown write fails is written by the next flush."""
+    doc_id = "test_doc"
+    document_tool.update_section(doc_id, "Introduction", "Hello.")
+
+    with patch.object(
+        document_tool, "_write_markdown", side_effect=OSError("disk full")
+    ):
+        with pytest.raises(OSError):
+            document_tool.flush()
+    assert doc_id in document_tool._pending_markdown
+
+    document_tool.flush()
+    assert not document_tool._pending_markdown
+    assert "Hello." in (Path(document_tool.storage_dir) / f"{doc_id}.md").read_text()
+
+
+def test_section_index_tracks_updates(document_tool):
+    """Test the section index is built lazily and updated on writes."""
+    doc_id = "test_doc"
+    document_tool.update_section(doc_id, "Introduction", "Welcome to the intro.")
+    document_tool.update_section(doc_id, "Methods", "1. First step")
+
+    index = document_tool._section_indexes[doc_id]
+    assert index.ids == ["section_1", "section_2"]
+    assert index.titles == ["introduction", "methods"]
+    assert index.lsh.query(index.signature(1)) == {"section_2"}
+
+    # Merged sections are replaced in place, keeping document order
+    document_tool.update_section(doc_id, "Methods", "1. First step\n\n2. Second step")
+    assert index.ids == ["section_1", "section_2"]
+    merged = document_tool.get_document(doc_id).sections["section_2"]
+    assert index.contents[1] == merged.content.lower()
+    assert index.lsh.query(index.signature(1)) == {"section_2"}
+
+
+def test_update_section_async_merges_with_async_client(storage_dir, doc_mock_openai):
+    """Test async updates await the async client instead of the sync one."""
+    async_client = MagicMock()
+    parse_response = parsed_response(
+        MergeResult(
+            merged_title="Methods",
+            merged_content="1. First step\n2. Second step",
+            source_sections=["Methods"],
+        )
+    )
+    async_client.responses.parse = AsyncMock(return_value=parse_response)
+    tool = DocumentWriterTool(
+        storage_dir=storage_dir,
+        openai_client=doc_mock_openai,
+        async_openai_client=async_client,
+    )
+
+    doc_id = "test_doc"
+    asyncio.run(tool.update_section_async(doc_id, "Methods", "1. First step"))
+    section = asyncio.run(
+        tool.update_section_async(doc_id, "Methods", "1. First step\n2. Next step")
+    )
+
+    assert section.content == "1. First step\n2. Second step"
+    assert section.version == 1
+    assert list(tool.get_document(doc_id).sections) == ["section_1"]
+    async_client.responses.parse.assert_awaited_once()
+    doc_mock_openai.responses.parse.assert_not_called()
+
+
+def test_concurrent_async_updates_to_one_section(storage_dir, doc_mock_openai):
+    """Test gathered updates to one section each merge into the previous result."""
+
+    async def mock_parse(**kwargs):
+        # Let the other update run while this merge is in flight
+        await asyncio.sleep(0)
+        prompt = kwargs["input"][0]["content"]
+        optimizer = "Adam" if "Adam" in prompt else "SGD"
+        epochs = 20 if "20 epochs" in prompt else 10
+        return parsed_response(
+            MergeResult(
+                merged_title="Methods",
+                merged_content=f"We train the model with {optimizer} for {epochs} epochs.",
+                source_sections=["Methods"],
+            )
+        )
+
+    async_client = MagicMock()
+    async_client.responses.parse = AsyncMock(side_effect=mock_parse)
+    tool = DocumentWriterTool(
+        storage_dir=storage_dir,
+        openai_client=doc_mock_openai,
+        async_openai_client=async_client,
+    )
+    doc_id = "test_doc"
+    tool.update_section(doc_id, "Methods", "We train the model with SGD for 10 epochs.")
+
+    async def update_concurrently():
+        return await asyncio.gather(
+            tool.update_section_async(
+                doc_id,
+                "Methods",
+                "We train the model with the Adam optimizer for 10 epochs.",
+            ),
+            tool.update_section_async(
+                doc_id,
+                "Methods",
+                "We train the model with SGD for 20 epochs on four GPUs.",
+            ),
+        )
+
+    asyncio.run(update_concurrently())
+
+    section = tool.get_document(doc_id).sections["section_1"]
+    assert section.version == 2
+    assert section.content == "We train the model with Adam for 20 epochs."
+    assert async_client.responses.parse.await_count == 2
@@ -0,0 +1,74 @@
+"""Tests for fast bigram similarity kernels."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from edison.tools import _fastsim
+from edison.tools._fastsim import (
+    _dice_scores_numpy,
+    _jit_dice_kernel,
+    dice_scores,
+    pack_bigrams,
+    text_bigrams,
+)
+
+
+def _reference_dice(text1, text2):
+    bigrams1 = {text1[i : i + 2] for i in range(len(text1) - 1)}
+    bigrams2 = {text2[i : i + 2] for i in range(len(text2) - 1)}
+    total = len(bigrams1) + len(bigrams2)
+    return 2 * len(bigrams1 & bigrams2) / total if total else 0.0
+
+
+def test_text_bigrams():
+    """Test bigrams are distinct, sorted and read-only."""
+    bigrams = text_bigrams("abab")
+    assert len(bigrams) == 2
+    assert np.all(np.diff(bigrams) > 0)
+    assert not bigrams.flags.writeable
+    assert len(text_bigrams("a")) == 0
+    assert len(text_bigrams("é✓")) == 1
+
+
+@pytest.mark.parametrize("scorer", [dice_scores, _dice_scores_numpy, "jit"])
+def test_dice_scores_match_reference(scorer):
+    """Test every implementation matches set-based Dice, including empty texts."""
+    if scorer == "jit":
+        scorer = _jit_dice_kernel()
+        if scorer is None:
+            pytest.skip("Numba is not installed")
+    query = "gradient descent"
+    texts = [
+        "gradient descent",
+        "stochastic gradient",
+        "",
+        "x",
+        "cooking",
+        "descent gradient",
+    ]
+    corpus, offsets = pack_bigrams([text_bigrams(t) for t in texts])
+
+    scores = scorer(text_bigrams(query), corpus, offsets)
+    assert scores == pytest.approx([_reference_dice(query, t) for t in texts])
+
+
+def test_pack_bigrams_empty():
+    """Test packing no texts yields no scores."""
+    corpus, offsets = pack_bigrams([])
+    assert len(dice_scores(text_bigrams("abc"), corpus, offsets)) == 0
+
+
+def test_small_corpora_use_numpy(monkeypatch):
+    """Test the compiled kernel is not loaded for prefilter-sized corpora."""
+    kernel = MagicMock()
+    monkeypatch.setattr(_fastsim, "_jit_dice_kernel", kernel)
+    corpus, offsets = pack_bigrams([text_bigrams("gradient descent")])
+
+    dice_scores(text_bigrams("gradient"), corpus, offsets)
+    kernel.assert_not_called()
+
+    monkeypatch.setattr(_fastsim, "JIT_MIN_CORPUS", 0)
+    dice_scores(text_bigrams("gradient"), corpus, offsets)
+    kernel.assert_called_once()
@@ -0,0 +1,101 @@
+"""Tests for MinHash signatures."""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from edison.tools.minhash import (
+    NUM_PERM,
+    MinHashLSH,
+    minhash_signature,
+    jaccard_estimates,
+)
+
+
+def test_signature_shape_and_determinism():
+    """Test signatures have a fixed shape and ignore token order."""
+    sig1 = minhash_signature(["alpha", "beta", "gamma"])
+    sig2 = minhash_signature(["gamma", "alpha", "beta", "beta"])
+
+    assert sig1.shape == (NUM_PERM,)
+    assert sig1.dtype == np.uint64
+    assert np.array_equal(sig1, sig2)
+    assert not sig1.flags.writeable
+
+
+def test_signature_is_stable_across_processes():
+    """Test signatures do not depend on the per-process hash seed."""
+    code = (
+        "from edison.tools.minhash import minhash_signature;"
+        "print(minhash_signature(['alpha', 'beta']).tolist())"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "PYTHONHASHSEED": "0"},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert output == f"{minhash_signature(['alpha', 'beta']).tolist()}\n"
+
+
+def test_empty_signature():
+    """Test empty token sets produce a constant signature."""
+    assert np.array_equal(minhash_signature([]), minhash_signature(iter(())))
+
+
+@pytest.mark.parametrize(
+    "tokens1,tokens2,expected",
+    [
+        ("a b c d e f g h", "a b c d e f g h", 1.0),
+        ("a b c d e f g h", "a b c d i j k l", 1 / 3),
+        ("a b c d", "e f g h", 0.0),
+    ],
+)
+def test_jaccard_estimates(tokens1, tokens2, expected):
+    """Test estimates approximate the true Jaccard similarity."""
+    signatures = np.stack([minhash_signature(tokens1.split())])
+    estimates = jaccard_estimates(signatures, minhash_signature(tokens2.split()))
+
+    assert estimates.shape == (1,)
+    assert estimates[0] == pytest.approx(expected, abs=0.15)
+
+
+def test_lsh_insert_query_remove():
+    """Test LSH candidates track inserted, replaced and removed keys."""
+    index = MinHashLSH()
+    tokens = "neural networks learn with gradient descent".split()
+    index.insert("a", minhash_signature(tokens))
+    index.insert("b", minhash_signature("completely unrelated words here".split()))
+
+    assert len(index) == 2
+    assert index.query(minhash_signature(tokens)) == {"a"}
+
+    index.insert("a", minhash_signature("something else entirely".split()))
+    assert index.query(minhash_signature(tokens)) == set()
+
+    index.remove("b")
+    index.remove("missing")
+    assert "b" not in index
+    assert len(index) == 1
+
+
+def test_lsh_rejects_invalid_bands():
+    """Test bands and rows must cover the whole signature."""
+    with pytest.raises(ValueError):
+        MinHashLSH(bands=10, rows=10)
+
+
+@pytest.mark.parametrize(
+    "threshold,bands,rows", [(0.5, 32, 4), (0.7, 16, 8), (0.9, 8, 16)]
+)
+def test_lsh_for_threshold(threshold, bands, rows):
+    """Test the band split is chosen to match the target similarity."""
+    index = MinHashLSH.for_threshold(threshold)
+    assert (index.bands, index.rows) == (bands, rows)
+
+    with pytest.raises(ValueError):
+        MinHashLSH.for_threshold(1.5)
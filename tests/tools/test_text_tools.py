@@ -1,9 +1,12 @@
 """Tests for text analysis tools."""
 
+import asyncio
 import pytest
-from datetime import datetime
-from unittest.mock import Mock, patch, MagicMock
-from edison.tools.text_tools import TextAnalyzer
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
+from edison.tools import text_tools
+from ._shared import FIXED_NOW, METHODOLOGY_MERGE, assert_compare_call, parsed_response
+from edison.tools.text_tools import SectionIndex, TextAnalyzer, _default_openai
 from edison.models import (
     DocumentContent,
     DocumentSection,
@@ -11,52 +14,65 @@ from edison.models import (
     MergeResult,
 )
 
+_MOCKED_COMPARE = ComparisonResult(similarity_score=0.5, explanation="mocked")
+_METHODS_MERGE = MergeResult(
+    merged_title="Methods", merged_content="1. First step", source_sections=["Methods"]
+)
 
-@pytest.fixture
-def mock_openai():
-    """Provides a mocked OpenAI client."""
-    with patch("openai.OpenAI") as mock:
-        client = MagicMock()
-        mock.return_value = client
 
-        # Mock the responses.parse method
-        parse_response = MagicMock()
-        parse_response.output_parsed = 0.9  # Default similarity score
-        client.responses.parse = MagicMock(return_value=parse_response)
+@pytest.fixture(scope="module")
+def populated_doc(_now):
+    """Provides a read-only document with introduction and methods sections."""
+    return DocumentContent(
+        sections={
+            "section_1": DocumentSection(
+                title="Introduction",
+                content="This is an introduction to the topic.",
+                last_modified=_now,
+            ),
+            "section_2": DocumentSection(
+                title="Methods",
+                content="These are the methods we used.",
+                last_modified=_now,
+            ),
+        },
+        metadata=[],
+        created_at=_now,
+        last_modified=_now,
+    )
+
 
-        yield client
+@pytest.fixture(scope="module")
+def empty_doc(_now):
+    """Provides a read-only document without sections."""
+    return DocumentContent(
+        sections={}, metadata=[], created_at=_now, last_modified=_now
+    )
 
 
 @pytest.fixture
-def analyzer(mock_openai):
-    """Provides a TextAnalyzer instance with mocked OpenAI."""
-    return TextAnalyzer(openai_client=mock_openai)
+def text_mock_openai(mock_openai):
+    """Provides the mocked OpenAI client, returning a similarity score by default."""
+    mock_openai.responses.parse.return_value = parsed_response(0.9)
+    return mock_openai
 
 
-def test_calculate_similarity(analyzer, mock_openai):
-    """Test text similarity calculation."""
+@pytest.fixture(scope="session")
+def _shared_analyzer():
+    """Provides one TextAnalyzer for the whole session."""
+    return TextAnalyzer(openai_client=MagicMock())
 
-    # Setup parse response for different scenarios
-    def mock_parse(**kwargs):
-        text1 = (
-            kwargs["input"][0]["content"]
-            .split("Text 1:")[1]
-            .split("Text 2:")[0]
-            .strip()
-        )
-        text2 = kwargs["input"][0]["content"].split("Text 2:")[1].strip()
 
-        response = MagicMock()
-        if text1 == text2:
-            response.output_parsed = 1.0
-        elif not text1 or not text2:
-            response.output_parsed = 0.0
-        else:
-            response.output_parsed = 0.5
-        return response
+@pytest.fixture
+def analyzer(_shared_analyzer, text_mock_openai):
+    """Provides the shared TextAnalyzer using this test's mocked client."""
+    _shared_analyzer.openai = text_mock_openai
+    _shared_analyzer._result_cache.clear()
+    return _shared_analyzer
 
-    mock_openai.responses.parse.side_effect = mock_parse
 
+def test_calculate_similarity(analyzer, text_mock_openai):
+    """Test text similarity calculation."""
     # Test cases
     assert analyzer.calculate_similarity("hello world", "hello world") == 1.0
     assert analyzer.calculate_similarity("Hello World", "hello world") > 0.4
@@ -65,29 +81,13 @@ def test_calculate_similarity(analyzer, mock_openai):
     assert analyzer.calculate_similarity("", "") == 0.0
     assert analyzer.calculate_similarity("hello", "") == 0.0
 
+    # Similarity is scored locally, without calling OpenAI
+    text_mock_openai.responses.parse.assert_not_called()
 
-def test_find_most_relevant_section(analyzer):
-    """Test finding relevant sections in documents."""
-    now = datetime.now()
 
-    # Create test document with sections
-    doc = DocumentContent(
-        sections={
-            "section_1": DocumentSection(
-                title="Introduction",
-                content="This is an introduction to the topic.",
-                last_modified=now,
-            ),
-            "section_2": DocumentSection(
-                title="Methods",
-                content="These are the methods we used.",
-                last_modified=now,
-            ),
-        },
-        metadata=[],
-        created_at=now,
-        last_modified=now,
-    )
+def test_find_most_relevant_section(analyzer, populated_doc, empty_doc):
+    """Test finding relevant sections in documents."""
+    doc = populated_doc
 
     # Test exact match
     section_id, score = analyzer.find_most_relevant_section(
@@ -110,9 +110,6 @@ def test_find_most_relevant_section(analyzer):
     assert score < 0.55
 
     # Test empty document
-    empty_doc = DocumentContent(
-        sections={}, metadata=[], created_at=now, last_modified=now
-    )
     section_id, score = analyzer.find_most_relevant_section(
         empty_doc, "Title", "Content"
     )
@@ -120,63 +117,32 @@ def test_find_most_relevant_section(analyzer):
     assert score == 0.0
 
 
-def test_compare_sections_with_structured_output(analyzer, mock_openai):
+def test_compare_sections_with_structured_output(
+    analyzer, text_mock_openai, sample_sections
+):
     """Test section comparison using structured outputs."""
-    section1 = DocumentSection(
-        title="Introduction",
-        content="This is an introduction.",
-        last_modified=datetime.now(),
-    )
-    section2 = DocumentSection(
-        title="Intro",
-        content="This is an intro.",
-        last_modified=datetime.now(),
-    )
+    section1 = sample_sections.intro
+    section2 = sample_sections.intro_short
 
-    # Mock responses.parse return value
-    mock_result = ComparisonResult(
-        similarity_score=0.9,
-        explanation="The sections are nearly identical with minor wording differences.",
+    mock_result, result = assert_compare_call(
+        text_mock_openai, section1, section2, analyzer.compare_sections
     )
-    parse_response = MagicMock()
-    parse_response.output_parsed = mock_result
-    mock_openai.responses.parse.return_value = parse_response
+    assert result is mock_result
 
-    result = analyzer.compare_sections(section1, section2)
-    assert isinstance(result, ComparisonResult)
-    assert result.similarity_score == 0.9
-    assert "nearly identical" in result.explanation
-
-    # Verify OpenAI was called with correct parameters
-    mock_openai.responses.parse.assert_called_once()
-    call_args = mock_openai.responses.parse.call_args[1]
-    assert call_args["model"] == "gpt-4-turbo-preview"
-    assert call_args["text_format"] == ComparisonResult
-    assert "Compare these two document sections" in call_args["input"][0]["content"]
+    # Comparisons are symmetric, so the reversed pair is served from the cache
+    assert analyzer.compare_sections(section2, section1) is mock_result
+    text_mock_openai.responses.parse.assert_called_once()
 
 
-def test_merge_sections_with_structured_output(analyzer, mock_openai):
+def test_merge_sections_with_structured_output(
+    analyzer, text_mock_openai, sample_sections
+):
     """Test section merging using structured outputs."""
-    section1 = DocumentSection(
-        title="Methods",
-        content="1. First step\n2. Second step",
-        last_modified=datetime.now(),
-    )
-    section2 = DocumentSection(
-        title="Methodology",
-        content="1. Initial phase\n2. Second phase",
-        last_modified=datetime.now(),
-    )
+    section1 = sample_sections.methods
+    section2 = sample_sections.methodology
 
     # Mock responses.parse return value
-    mock_result = MergeResult(
-        merged_title="Research Methodology",
-        merged_content="1. First step (Initial phase)\n2. Second step (Second phase)",
-        source_sections=["Methods", "Methodology"],
-    )
-    parse_response = MagicMock()
-    parse_response.output_parsed = mock_result
-    mock_openai.responses.parse.return_value = parse_response
+    text_mock_openai.responses.parse.return_value = parsed_response(METHODOLOGY_MERGE)
 
     result = analyzer.merge_sections(section1, section2)
     assert isinstance(result, MergeResult)
@@ -186,26 +152,30 @@ def test_merge_sections_with_structured_output(analyzer, mock_openai):
     assert len(result.source_sections) == 2
 
     # Verify OpenAI was called with correct parameters
-    call_args = mock_openai.responses.parse.call_args[1]
-    assert call_args["model"] == "gpt-4-turbo-preview"
-    assert call_args["text_format"] == MergeResult
-    assert "Merge these two document sections" in call_args["input"][0]["content"]
-
-
-def test_invalid_openai_responses(analyzer, mock_openai):
-    """Test handling of invalid OpenAI responses."""
-    section = DocumentSection(
-        title="Test",
-        content="Content",
-        last_modified=datetime.now(),
-    )
-
-    # Test API error
-    mock_openai.responses.parse.side_effect = Exception("API Error")
+    text_mock_openai.responses.parse.assert_called_once()
+    kwargs = text_mock_openai.responses.parse.call_args.kwargs
+    assert kwargs["model"] == "gpt-4o-mini"
+    assert kwargs["temperature"] == 0
+    assert kwargs["text_format"] == MergeResult
+    assert "Merge these two document sections" in kwargs["input"][0]["content"]
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        Exception("API Error"),
+        ValueError("Invalid format"),
+        ValueError("Missing required field"),
+    ],
+    ids=["api_error", "invalid_format", "missing_field"],
+)
+def test_failed_openai_responses(analyzer, text_mock_openai, sample_sections, error):
+    """Test failed OpenAI calls fall back to default results."""
+    section = sample_sections.test_1
+    text_mock_openai.responses.parse.side_effect = error
 
     # calculate_similarity doesn't use OpenAI, so it should work normally
-    similarity = analyzer.calculate_similarity("text1", "text2")
-    assert similarity > 0.0
+    assert analyzer.calculate_similarity("text1", "text2") > 0.0
 
     # Should return default ComparisonResult for compare_sections
     result = analyzer.compare_sections(section, section)
@@ -221,20 +191,432 @@ def test_invalid_openai_responses(analyzer, mock_openai):
     assert len(result.source_sections) == 1
 
 
-def test_structured_output_validation(analyzer, mock_openai):
-    """Test validation of structured outputs."""
-    section = DocumentSection(
-        title="Test", content="Content", last_modified=datetime.now()
+def test_find_most_relevant_section_large_document(analyzer):
+    """Test MinHash candidate selection on documents with many sections."""
+    now = FIXED_NOW
+    sections = {
+        f"section_{i}": DocumentSection(
+            title=f"Topic {i}",
+            content=f"Notes about subject {i} with details {i * 7} and {i * 13}.",
+            last_modified=now,
+        )
+        for i in range(200)
+    }
+    sections["section_target"] = DocumentSection(
+        title="Neural Networks",
+        content="Neural networks are trained with backpropagation and gradient descent.",
+        last_modified=now,
+    )
+    doc = DocumentContent(
+        sections=sections, metadata=[], created_at=now, last_modified=now
     )
 
-    # Test invalid similarity score type
-    mock_openai.responses.parse.side_effect = ValueError("Invalid format")
-    result = analyzer.compare_sections(section, section)
-    assert result.similarity_score == 0.0
-    assert "Failed to compare sections" in result.explanation
+    section_id, score = analyzer.find_most_relevant_section(
+        doc,
+        "Neural Networks",
+        "Neural networks are trained with backpropagation and gradient descent.",
+    )
+    assert section_id == "section_target"
+    assert score > 0.9
 
-    # Test missing required field
-    mock_openai.responses.parse.side_effect = ValueError("Missing required field")
-    result = analyzer.merge_sections(section, section)
-    assert result.merged_title == section.title
-    assert result.merged_content == section.content
+    # Candidates found through the index's LSH give the same answer
+    index = SectionIndex(sections)
+    section_id, score = analyzer.find_most_relevant_section(
+        doc,
+        "Neural Networks",
+        "Neural networks are trained with backpropagation and gradient descent.",
+        index=index,
+    )
+    assert section_id == "section_target"
+    assert score > 0.9
+    assert index.positions(["section_target", "section_1"]) == [1, 200]
+
+
+def test_merge_sections_results_are_cached(analyzer, text_mock_openai):
+    """Test repeated merges of the same sections reuse the cached result."""
+    section1 = DocumentSection(
+        title="Methods", content="1. First step", last_modified=FIXED_NOW
+    )
+    section2 = DocumentSection(
+        title="Methods", content="1. Initial step", last_modified=FIXED_NOW
+    )
+
+    text_mock_openai.responses.parse.return_value = parsed_response(_METHODS_MERGE)
+
+    first = analyzer.merge_sections(section1, section2)
+    second = analyzer.merge_sections(section1, section2)
+    assert first == second
+    text_mock_openai.responses.parse.assert_called_once()
+
+    # Failures are not cached
+    text_mock_openai.responses.parse.side_effect = Exception("API Error")
+    analyzer.compare_sections(section1, section2)
+    text_mock_openai.responses.parse.side_effect = None
+    analyzer.compare_sections(section1, section2)
+    assert text_mock_openai.responses.parse.call_count == 3
+
+
+def test_deterministic_merge(analyzer, text_mock_openai):
+    """Test local merging keeps existing paragraphs the update leaves out."""
+    section1 = DocumentSection(
+        title="Results",
+        content="First paragraph.\n\nSecond paragraph.",
+        last_modified=FIXED_NOW,
+    )
+    section2 = DocumentSection(
+        title="Results", content="First paragraph.", last_modified=FIXED_NOW
+    )
+
+    result = analyzer.deterministic_merge(section1, section2)
+    assert result.merged_title == "Results"
+    assert result.merged_content == "First paragraph.\n\nSecond paragraph."
+    text_mock_openai.responses.parse.assert_not_called()
+
+
+def test_deterministic_merge_declines_diverging_sections(analyzer):
+    """Test sections that both gained paragraphs are left to the model."""
+    section1 = DocumentSection(
+        title="Results", content="First paragraph.\n\nSecond paragraph."
+    )
+    section2 = DocumentSection(
+        title="Results", content="First paragraph.\n\nThird paragraph."
+    )
+
+    assert analyzer.deterministic_merge(section1, section2) is None
+
+
+def test_compare_sections_batch(text_mock_openai, async_analyzer):
+    """Test concurrent comparisons return results in input order."""
+    analyzer, async_client = async_analyzer
+
+    async def mock_parse(**kwargs):
+        content = kwargs["input"][0]["content"]
+        return parsed_response(
+            ComparisonResult(
+                similarity_score=0.9 if "Section 2 (Intro)" in content else 0.1,
+                explanation="mocked",
+            )
+        )
+
+    async_client.responses.parse = AsyncMock(side_effect=mock_parse)
+
+    intro = DocumentSection(title="Introduction", content="This is an introduction.")
+    pairs = [
+        (intro, DocumentSection(title="Intro", content="This is an intro.")),
+        (intro, DocumentSection(title="Methods", content="These are the methods.")),
+    ]
+
+    results = asyncio.run(analyzer.compare_sections_batch(pairs))
+    assert [r.similarity_score for r in results] == [0.9, 0.1]
+    assert async_client.responses.parse.await_count == 2
+    text_mock_openai.responses.parse.assert_not_called()
+
+
+def test_count_tokens(analyzer):
+    """Test token counting splits on any whitespace."""
+    assert analyzer.count_tokens("Hello  World\n\tagain") == 3
+    assert analyzer.count_tokens("") == 0
+
+
+def test_deterministic_merge_keeps_paragraph_order(analyzer):
+    """Test edited paragraphs are replaced in place."""
+    section1 = DocumentSection(
+        title="Steps", content="Step one.\n\nStep three.\n\nSummary."
+    )
+    section2 = DocumentSection(title="Steps", content="Step one.\n\nStep three!")
+
+    result = analyzer.deterministic_merge(section1, section2)
+    assert result.merged_content == "Step one.\n\nStep three!\n\nSummary."
+
+
+@pytest.mark.parametrize(
+    "incoming",
+    [
+        "Our model reaches 92% accuracy on the held-out benchmark.",
+        "Our model reaches 91% accuracy on the held-out benchmark. "
+        "Training takes two hours.",
+    ],
+    ids=["edited", "appended"],
+)
+def test_deterministic_merge_replaces_edited_paragraph(analyzer, incoming):
+    """Test an edited paragraph replaces its old version instead of repeating it."""
+    section1 = DocumentSection(
+        title="Results",
+        content="Our model reaches 91% accuracy on the held-out benchmark.",
+    )
+    section2 = DocumentSection(title="Results", content=incoming)
+
+    result = analyzer.deterministic_merge(section1, section2)
+    assert result.merged_content == incoming
+
+
+def test_default_openai_client_is_shared(monkeypatch):
+    """Test analyzers without a client share one process-wide OpenAI client."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    _default_openai.cache_clear()
+    try:
+        with patch("edison.tools.text_tools.OpenAI") as openai_cls:
+            first = TextAnalyzer()
+            second = TextAnalyzer()
+
+        openai_cls.assert_called_once()
+        assert openai_cls.call_args.kwargs["api_key"] == "test-key"
+        assert openai_cls.call_args.kwargs["http_client"] is not None
+        assert first.openai is second.openai
+    finally:
+        _default_openai.cache_clear()
+
+
+def test_default_async_client_is_shared_per_loop(text_mock_openai, monkeypatch):
+    """Test analyzers share one async client per event loop."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    first = TextAnalyzer(openai_client=text_mock_openai)
+    second = TextAnalyzer(openai_client=text_mock_openai)
+
+    async def clients():
+        return first.async_openai, second.async_openai
+
+    with patch("edison.tools.text_tools.AsyncOpenAI") as async_openai_cls:
+        async_openai_cls.side_effect = lambda **kwargs: MagicMock()
+        loop1 = asyncio.run(clients())
+        loop2 = asyncio.run(clients())
+
+    assert loop1[0] is loop1[1]
+    assert loop2[0] is loop2[1]
+    assert loop1[0] is not loop2[0]
+
+
+def test_find_most_relevant_section_exact_match_skips_scoring(analyzer):
+    """Test an identical section is returned without running the scorer."""
+    doc = DocumentContent(
+        sections={
+            "section_1": DocumentSection(title="Methods", content="Step one."),
+            "section_2": DocumentSection(title="Results", content="It worked."),
+        }
+    )
+
+    with patch("edison.tools.text_tools.process.cdist") as cdist:
+        section_id, score = analyzer.find_most_relevant_section(
+            doc, "results", "It Worked."
+        )
+
+    assert section_id == "section_2"
+    assert score == 1.0
+    cdist.assert_not_called()
+    assert analyzer.calculate_similarity("same text", "same text") == 1.0
+
+
+def test_find_most_relevant_section_scores_plausible_content_first(analyzer):
+    """Test content is only scored for sections with similar titles when one matches."""
+    doc = DocumentContent(
+        sections={
+            "section_1": DocumentSection(title="Methods", content="We used tools."),
+            "section_2": DocumentSection(
+                title="Introduction", content="This is an introduction."
+            ),
+            "section_3": DocumentSection(title="Results", content="It worked."),
+        }
+    )
+
+    with patch(
+        "edison.tools.text_tools.process.cdist", wraps=text_tools.process.cdist
+    ) as cdist:
+        section_id, score = analyzer.find_most_relevant_section(
+            doc, "Intro", "This is an intro."
+        )
+
+    assert section_id == "section_2"
+    assert score > 0.3
+    # One call for all titles, one for the single plausible section's content
+    assert [len(call.args[1]) for call in cdist.call_args_list] == [3, 1]
+
+
+def test_calculate_similarity_is_memoized(analyzer):
+    """Test symmetric similarity calls share one cached score."""
+    analyzer.clear_caches()
+
+    first = analyzer.calculate_similarity("hello world", "hello there")
+    second = analyzer.calculate_similarity("hello there", "hello world")
+
+    assert first == second
+    info = text_tools._pair_similarity.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+    analyzer.clear_caches()
+    assert text_tools._pair_similarity.cache_info().currsize == 0
+
+
+def test_find_most_relevant_section_dice_prefilter(analyzer):
+    """Test content is only scored exactly for the closest sections by bigram Dice."""
+    sections = {
+        f"section_{i}": DocumentSection(
+            title="Notes", content=f"Unrelated filler number {i} about cooking."
+        )
+        for i in range(20)
+    }
+    sections["section_target"] = DocumentSection(
+        title="Notes", content="Gradient descent minimizes the training loss."
+    )
+    doc = DocumentContent(sections=sections)
+
+    with patch(
+        "edison.tools.text_tools.process.cdist", wraps=text_tools.process.cdist
+    ) as cdist:
+        section_id, score = analyzer.find_most_relevant_section(
+            doc, "Notes", "Gradient descent minimizes the loss."
+        )
+
+    assert section_id == "section_target"
+    assert score > 0.7
+    assert [len(call.args[1]) for call in cdist.call_args_list] == [
+        21,
+        text_tools.DICE_CANDIDATES,
+    ]
+
+
+def test_merge_sections_batch_preserves_order(text_mock_openai, async_analyzer):
+    """Test batched merges are chunked and returned in input order."""
+    analyzer, async_client = async_analyzer
+
+    async def mock_parse(**kwargs):
+        content = kwargs["input"][0]["content"]
+        title = content.split("Section 2 (")[1].split(")")[0]
+        return parsed_response(
+            MergeResult(
+                merged_title=title, merged_content="merged", source_sections=[title]
+            )
+        )
+
+    async_client.responses.parse = AsyncMock(side_effect=mock_parse)
+
+    base = DocumentSection(title="Base", content="Base content.")
+    pairs = [
+        (base, DocumentSection(title=f"Part {i}", content=f"Content {i}."))
+        for i in range(text_tools.MERGE_BATCH_SIZE + 5)
+    ]
+
+    results = asyncio.run(analyzer.merge_sections_batch(pairs))
+    assert [r.merged_title for r in results] == [s2.title for _, s2 in pairs]
+    assert async_client.responses.parse.await_count == len(pairs)
+    text_mock_openai.responses.parse.assert_not_called()
+
+
+def test_async_requests_are_bounded(async_analyzer):
+    """Test no more than MAX_CONCURRENT_REQUESTS async calls run at once."""
+    analyzer, async_client = async_analyzer
+    in_flight = peak = 0
+
+    async def mock_parse(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return parsed_response(_MOCKED_COMPARE)
+
+    async_client.responses.parse = AsyncMock(side_effect=mock_parse)
+
+    base = DocumentSection(title="Base", content="Base content.")
+    pairs = [
+        (base, DocumentSection(title=f"Part {i}", content=f"Content {i}."))
+        for i in range(3 * text_tools.MAX_CONCURRENT_REQUESTS)
+    ]
+
+    results = asyncio.run(analyzer.compare_sections_batch(pairs))
+    assert len(results) == len(pairs)
+    assert peak == text_tools.MAX_CONCURRENT_REQUESTS
+
+
+def test_custom_model(text_mock_openai):
+    """Test the configured model is used for requests and cache keys."""
+    analyzer = TextAnalyzer(openai_client=text_mock_openai, model="gpt-4o")
+    section1 = DocumentSection(title="Methods", content="1. First step")
+    section2 = DocumentSection(title="Methods", content="1. Initial step")
+
+    text_mock_openai.responses.parse.return_value = parsed_response(_METHODS_MERGE)
+
+    analyzer.merge_sections(section1, section2)
+    assert text_mock_openai.responses.parse.call_args.kwargs["model"] == "gpt-4o"
+    assert analyzer._cache_key("merge", section1, section2) != TextAnalyzer(
+        openai_client=text_mock_openai
+    )._cache_key("merge", section1, section2)
+
+
+def test_batch_sends_duplicate_pairs_once(async_analyzer):
+    """Test duplicate pairs in a batch share a single request."""
+    analyzer, async_client = async_analyzer
+    async_client.responses.parse = AsyncMock(
+        return_value=parsed_response(_MOCKED_COMPARE)
+    )
+
+    section1 = DocumentSection(title="Intro", content="Hello.")
+    section2 = DocumentSection(title="Intro", content="Hello there.")
+    pairs = [(section1, section2), (section2, section1), (section1, section2)]
+
+    results = asyncio.run(analyzer.compare_sections_batch(pairs))
+    assert len(results) == 3
+    assert async_client.responses.parse.await_count == 1
+
+
+class _FakeMergeStream:
+    """Replays two output fragments, then the parsed _METHODS_MERGE result."""
+
+    events = [
+        SimpleNamespace(type="response.created"),
+        SimpleNamespace(type="response.output_text.delta", delta='{"merged_title"'),
+        SimpleNamespace(type="response.output_text.delta", delta=': "Methods"}'),
+    ]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def __aiter__(self):
+        for event in self.events:
+            yield event
+
+    async def get_final_response(self):
+        return parsed_response(_METHODS_MERGE)
+
+
+def test_merge_sections_stream(async_analyzer):
+    """Test streamed merges yield output fragments, then the parsed result."""
+    analyzer, async_client = async_analyzer
+    async_client.responses.stream = MagicMock(return_value=_FakeMergeStream())
+    section1 = DocumentSection(title="Methods", content="1. First step")
+    section2 = DocumentSection(title="Methods", content="1. Initial step")
+
+    async def collect():
+        return [u async for u in analyzer.merge_sections_stream(section1, section2)]
+
+    updates = asyncio.run(collect())
+    assert [u.delta for u in updates[:-1]] == ['{"merged_title"', ': "Methods"}']
+    assert updates[-1].result == _METHODS_MERGE
+
+    # The final result is cached and replayed as a single update
+    updates = asyncio.run(collect())
+    assert len(updates) == 1 and updates[0].result == _METHODS_MERGE
+    async_client.responses.stream.assert_called_once()
+
+
+def test_merge_sections_stream_releases_slot_when_abandoned(async_analyzer):
+    """Test a stream the caller stops reading does not keep its request slot."""
+    analyzer, async_client = async_analyzer
+    async_client.responses.stream = MagicMock(return_value=_FakeMergeStream())
+    section1 = DocumentSection(title="Methods", content="1. First step")
+    section2 = DocumentSection(title="Methods", content="1. Initial step")
+
+    async def read_one_update():
+        updates = analyzer.merge_sections_stream(section1, section2)
+        first = await updates.__anext__()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        free_slots = analyzer._request_limiter()._value
+        await updates.aclose()
+        return first, free_slots
+
+    first, free_slots = asyncio.run(read_one_update())
+    assert first.delta == '{"merged_title"'
+    assert free_slots == text_tools.MAX_CONCURRENT_REQUESTS